@@ -5,27 +5,42 @@ Smallest AI Speech-to-Text - File Transcription
 Transcribe audio files with advanced features like word timestamps,
 speaker diarization, and emotion detection.
 
-Usage: python transcribe.py <audio_file>
+Usage: python transcribe.py <audio_file> [--compress]
 
 Output:
 - Command line response with feature outputs
 - {filename}_transcript.txt - Plain text transcription
 - {filename}_result.json - Full API response
+
+With --compress, both files are written zstd-compressed with a .zst suffix
+(requires the zstandard package).
 """
 
-import json
 import os
 import sys
 from pathlib import Path
 
+import orjson
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 load_dotenv()
 
 API_URL = "https://waves-api.smallest.ai/api/v1/pulse/get_text"
 OUTPUT_DIR = "."
 
+# Shared session: keeps the TLS connection alive across requests and retries
+# failed connection attempts
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3)))
+
 # The following are all the features supported by the POST endpoint (Pre-Recorded API)
 LANGUAGE = "en"  # Use ISO 639-1 codes or "multi" for auto-detect
 WORD_TIMESTAMPS = False
@@ -36,35 +51,43 @@ EMOTION_DETECTION = False
 
 
 def transcribe(audio_file: str, api_key: str) -> dict:
+    # Pass the open file so requests streams it instead of loading it into memory
     with open(audio_file, "rb") as f:
-        audio_data = f.read()
-
-    response = requests.post(
-        API_URL,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/octet-stream",
-        },
-        params={
-            "language": LANGUAGE,
-            "word_timestamps": str(WORD_TIMESTAMPS).lower(),
-            "diarize": str(DIARIZE).lower(),
-            "age_detection": str(AGE_DETECTION).lower(),
-            "gender_detection": str(GENDER_DETECTION).lower(),
-            "emotion_detection": str(EMOTION_DETECTION).lower(),
-        },
-        data=audio_data,
-        timeout=300,
-    )
+        response = SESSION.post(
+            API_URL,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/octet-stream",
+            },
+            params={
+                "language": LANGUAGE,
+                "word_timestamps": str(WORD_TIMESTAMPS).lower(),
+                "diarize": str(DIARIZE).lower(),
+                "age_detection": str(AGE_DETECTION).lower(),
+                "gender_detection": str(GENDER_DETECTION).lower(),
+                "emotion_detection": str(EMOTION_DETECTION).lower(),
+            },
+            data=f,
+            timeout=300,
+        )
 
     if response.status_code != 200:
         raise Exception(f"API request failed with status {response.status_code}: {response.text}")
 
     return response.json()
 
+
+def open_output(path: Path, mode: str):
+    """Open an output file, writing a zstd stream if the name ends in .zst."""
+    encoding = None if "b" in mode else "utf-8"
+    if path.suffix == ".zst":
+        return zstandard.open(path, mode, cctx=zstandard.ZstdCompressor(level=3), encoding=encoding)
+    return open(path, mode, encoding=encoding)
+
+
 # This function is designed to process feature outputs for all the features supported
 # by the POST endpoint (Pre-Recorded API)
-def process_response(result: dict, audio_path: Path):
+def process_response(result: dict, audio_path: Path, compress: bool = False):
     if result.get("status") != "success":
         print(f"Error: Transcription failed")
         print(result)
@@ -126,25 +149,34 @@ def process_response(result: dict, audio_path: Path):
     output_dir = Path(OUTPUT_DIR)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    text_path = output_dir / f"{audio_path.stem}_transcript.txt"
-    with open(text_path, "w", encoding="utf-8") as f:
+    suffix = ".zst" if compress else ""
+
+    text_path = output_dir / f"{audio_path.stem}_transcript.txt{suffix}"
+    with open_output(text_path, "w") as f:
         f.write(result.get("transcription", ""))
     print(f"Saved: {text_path}")
 
-    json_path = output_dir / f"{audio_path.stem}_result.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    json_path = output_dir / f"{audio_path.stem}_result.json{suffix}"
+    with open_output(json_path, "wb") as f:
+        f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
     print(f"Saved: {json_path}")
 
     print("\nDone!")
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python transcribe.py <audio_file>")
+    args = [arg for arg in sys.argv[1:] if arg != "--compress"]
+    compress = len(args) < len(sys.argv) - 1
+
+    if not args:
+        print("Usage: python transcribe.py <audio_file> [--compress]")
+        sys.exit(1)
+
+    if compress and zstandard is None:
+        print("Error: zstandard package not installed. Run: pip install zstandard")
         sys.exit(1)
 
-    audio_file = sys.argv[1]
+    audio_file = args[0]
     api_key = os.environ.get("SMALLEST_API_KEY")
 
     if not api_key:
@@ -160,7 +192,7 @@ def main():
     print(f"Transcribing with language: {LANGUAGE}")
 
     result = transcribe(audio_file, api_key)
-    process_response(result, audio_path)
+    process_response(result, audio_path, compress)
 
 
 if __name__ == "__main__":
@@ -26,11 +26,18 @@ from pathlib import Path
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 load_dotenv()
 
 API_URL = "https://waves-api.smallest.ai/api/v1/pulse/get_text"
 
+# Shared session: keeps the TLS connection alive across requests and retries
+# failed connection attempts
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3)))
+
 LANGUAGE = "en"  # Use ISO 639-1 codes or "multi" for auto-detect
 
 SUMMARIZE_PROMPT = """You are an expert podcast summarizer. Analyze the following podcast transcript and create a concise, well-structured summary.
@@ -68,21 +75,20 @@ TRANSCRIPT:
 def transcribe(input_file: str, api_key: str) -> str:
     print("Transcribing...")
 
+    # Pass the open file so requests streams it instead of loading it into memory
     with open(input_file, "rb") as f:
-        file_data = f.read()
-
-    response = requests.post(
-        API_URL,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/octet-stream",
-        },
-        params={
-            "language": LANGUAGE,
-        },
-        data=file_data,
-        timeout=600,
-    )
+        response = SESSION.post(
+            API_URL,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/octet-stream",
+            },
+            params={
+                "language": LANGUAGE,
+            },
+            data=f,
+            timeout=600,
+        )
 
     if response.status_code != 200:
         raise Exception(f"API request failed with status {response.status_code}: {response.text}")
@@ -29,22 +29,21 @@ MAX_SEGMENT_DURATION = 5.0  # Maximum duration per segment in seconds
 
 
 def transcribe(audio_file: str, api_key: str) -> dict:
+    # Pass the open file so requests streams it instead of loading it into memory
     with open(audio_file, "rb") as f:
-        audio_data = f.read()
-
-    response = requests.post(
-        API_URL,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/octet-stream",
-        },
-        params={
-            "language": LANGUAGE,
-            "word_timestamps": "true",
-        },
-        data=audio_data,
-        timeout=300,
-    )
+        response = requests.post(
+            API_URL,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/octet-stream",
+            },
+            params={
+                "language": LANGUAGE,
+                "word_timestamps": "true",
+            },
+            data=f,
+            timeout=300,
+        )
 
     if response.status_code != 200:
         raise Exception(f"API request failed with status {response.status_code}: {response.text}")
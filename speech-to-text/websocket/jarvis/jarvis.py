@@ -8,7 +8,7 @@ with Smallest AI's speech APIs.
 Architecture:
 - STT: WebSocket streaming for low-latency transcription (stt.py)
 - LLM: Groq API with vision support for screenshots (llm.py)
-- TTS: HTTP POST for simplicity - upgrade to WebSocket for lower latency (tts.py)
+- TTS: WebSocket streaming, playback starts with the first audio chunk (tts.py)
 
 State Machine:
 - LISTENING: Waiting for wake word "Jarvis"
@@ -25,7 +25,7 @@ import time
 
 from dotenv import load_dotenv
 
-from llm import LLMClient
+from llm import ConversationContext, LLMClient
 from stt import STTClient
 from tts import TTSClient
 
@@ -50,10 +50,11 @@ class JarvisAssistant:
     def __init__(self):
         self.llm = LLMClient()
         self.stt = STTClient()
+        self.tts = TTSClient()
 
         self.state = "LISTENING"
         self.query_buffer = []
-        self.conversation_history = []
+        self.conversation_history = ConversationContext()
         self.last_transcript_time = 0
         self.last_conversation_time = 0
 
@@ -74,12 +75,18 @@ class JarvisAssistant:
         print("-" * 50)
         print("[LISTENING] Waiting for wake word...")
 
-        while self.running:
-            try:
-                await self._stt_session()
-            except Exception as e:
-                print(f"[STT] Reconnecting... ({e})")
-                await asyncio.sleep(1)
+        self.tts.start()
+        try:
+            while self.running:
+                try:
+                    await self._stt_session()
+                except Exception as e:
+                    print(f"[STT] Reconnecting... ({e})")
+                    await asyncio.sleep(1)
+        finally:
+            self.tts.stop()
+            await self.tts.close()
+            await self.llm.close()
 
     async def _stt_session(self):
         """Run STT session with send/receive loop."""
@@ -92,8 +99,8 @@ class JarvisAssistant:
                     await asyncio.sleep(0.05)
                     continue
 
-                while not self.stt.audio_queue.empty():
-                    await self.stt.ws.send(self.stt.audio_queue.get_nowait())
+                while self.stt.audio_queue:
+                    await self.stt.ws.send(self.stt.audio_queue.popleft())
                 await asyncio.sleep(0.05)
 
         async def receive_transcripts():
@@ -127,7 +134,7 @@ class JarvisAssistant:
         print("\n[WAKE] Detected! Listening...")
         self.state = "CAPTURING"
         self.query_buffer = []
-        self.conversation_history = []
+        self.conversation_history.clear()
         self.last_transcript_time = time.time()
         self.last_conversation_time = time.time()
 
@@ -174,7 +181,7 @@ class JarvisAssistant:
                 elif time.time() - self.last_conversation_time > CONVERSATION_TIMEOUT:
                     print("\n[TIMEOUT] Erasing context and returning to wake word detection...")
                     self.state = "LISTENING"
-                    self.conversation_history = []
+                    self.conversation_history.clear()
                     print("[LISTENING] Waiting for wake word...")
                 else:
                     self._restart_timer()
@@ -192,13 +199,13 @@ class JarvisAssistant:
             return
 
         if time.time() - self.last_conversation_time > CONVERSATION_TIMEOUT:
-            self.conversation_history = []
+            self.conversation_history.clear()
 
         self.state = "PROCESSING"
         print(f"\n[QUERY] {query}")
         self.jarvis_speaking = True
 
-        response, is_stop = self.llm.get_response(query, self.conversation_history)
+        response, is_stop = await self.llm.get_response(query, self.conversation_history)
 
         if is_stop:
             print("[STOP] Ignoring unrelated speech")
@@ -210,17 +217,14 @@ class JarvisAssistant:
 
         print(f"[RESPONSE] {response}")
 
-        tts = TTSClient()
         try:
-            tts.start()
-            await tts.speak(response)
+            await self.tts.speak(response)
         finally:
-            tts.stop()
             self.stt.clear_queue()
             self.jarvis_speaking = False
 
-        self.conversation_history.append({"role": "user", "content": query})
-        self.conversation_history.append({"role": "assistant", "content": response})
+        self.conversation_history.add("user", query)
+        self.conversation_history.add("assistant", response)
 
         self.last_conversation_time = time.time()
         self.state = "CAPTURING"
@@ -13,14 +13,17 @@ the stronger text model for reasoning while using the vision model for perceptio
 Further scope: Add tool calling for web search, calendar, smart home, etc.
 """
 
+import asyncio
 import base64
 import os
 import platform
 import shutil
 import subprocess
 import tempfile
+from collections import deque
 
-from groq import Groq
+import httpx
+from groq import AsyncGroq
 
 LLM_MODEL = "llama-3.3-70b-versatile"
 LLM_VISION_MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
@@ -44,13 +47,39 @@ IMAGE DESCRIPTION:
 <brief description>"""
 
 
+def _flameshot(filepath: str) -> bytes | None:
+    """flameshot prints the PNG to stdout, so the image never touches disk."""
+    result = subprocess.run(["flameshot", "gui", "--raw"], capture_output=True)
+    if result.returncode == 0 and result.stdout:
+        return result.stdout
+    return None
+
+
+# Linux screenshot tools in order of preference. Each writes to the given path,
+# or returns the PNG bytes directly.
+LINUX_SCREENSHOT_TOOLS = {
+    "flameshot": _flameshot,
+    "spectacle": lambda path: subprocess.run(["spectacle", "-r", "-b", "-o", path], check=True),
+    "gnome-screenshot": lambda path: subprocess.run(["gnome-screenshot", "-a", "-f", path], check=True),
+    "scrot": lambda path: subprocess.run(["scrot", "-s", path], check=True),
+    "import": lambda path: subprocess.run(["import", path], check=True),
+}
+
+# Resolved once at import instead of on every screenshot
+SYSTEM = platform.system()
+LINUX_SCREENSHOT_TOOL = (
+    next((tool for tool in LINUX_SCREENSHOT_TOOLS if shutil.which(tool)), None)
+    if SYSTEM == "Linux" else None
+)
+
+
 def take_screenshot() -> str | None:
     """Capture screen region using native tools. Returns base64 image or None."""
-    system = platform.system()
+    # Path only: scrot writes to a new name if the file already exists
     filepath = tempfile.mktemp(suffix=".png")
 
     try:
-        if system == "Windows":
+        if SYSTEM == "Windows":
             subprocess.run(["snippingtool", "/clip"], check=True)
             ps_cmd = f'''
             Add-Type -AssemblyName System.Windows.Forms
@@ -59,84 +88,116 @@ def take_screenshot() -> str | None:
             '''
             subprocess.run(["powershell", "-Command", ps_cmd], check=True)
 
-        elif system == "Linux":
-            if shutil.which("flameshot"):
-                result = subprocess.run(["flameshot", "gui", "--raw"], capture_output=True)
-                if result.returncode == 0 and result.stdout:
-                    with open(filepath, "wb") as f:
-                        f.write(result.stdout)
-            elif shutil.which("spectacle"):
-                subprocess.run(["spectacle", "-r", "-b", "-o", filepath], check=True)
-            elif shutil.which("gnome-screenshot"):
-                subprocess.run(["gnome-screenshot", "-a", "-f", filepath], check=True)
-            elif shutil.which("scrot"):
-                subprocess.run(["scrot", "-s", filepath], check=True)
-            elif shutil.which("import"):
-                subprocess.run(["import", filepath], check=True)
-            else:
+        elif SYSTEM == "Linux":
+            if not LINUX_SCREENSHOT_TOOL:
                 print("[Screenshot] No tool found")
                 return None
+            image = LINUX_SCREENSHOT_TOOLS[LINUX_SCREENSHOT_TOOL](filepath)
+            if isinstance(image, bytes):
+                return base64.b64encode(image).decode("utf-8")
 
-        elif system == "Darwin":
+        elif SYSTEM == "Darwin":
             subprocess.run(["screencapture", "-i", filepath], check=True)
 
-        if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
+        try:
             with open(filepath, "rb") as f:
-                return base64.b64encode(f.read()).decode("utf-8")
-        return None
+                image = f.read()
+        except FileNotFoundError:
+            # No capture file means the user cancelled the selection
+            return None
+        return base64.b64encode(image).decode("utf-8") if image else None
 
     except Exception as e:
         print(f"[Screenshot] Error: {e}")
         return None
     finally:
-        if os.path.exists(filepath):
+        try:
             os.unlink(filepath)
+        except FileNotFoundError:
+            pass
+
 
+class ConversationContext:
+    """
+    Conversation history as it is sent to the LLM: the first query-response
+    pair plus the last 3 pairs.
 
-def get_context_history(history: list) -> list:
-    """Get first query-response pair + last 3 pairs from history."""
-    n = len(history)
-    if n <= 2:
-        return history
+    Each message is formatted once when it's added, so building the prompt
+    on a new turn doesn't re-format the whole history.
+    """
 
-    first_pair = history[:2]
-    last_pairs_start = max(2, n - 6)
-    return first_pair + history[last_pairs_start:]
+    def __init__(self, recent_pairs: int = 3):
+        self.first_pair = []
+        self.recent = deque(maxlen=recent_pairs * 2)
+        self._text = None
+
+    def add(self, role: str, content: str):
+        """Append a message to the history."""
+        line = f"{'User' if role == 'user' else 'Jarvis'}: {content}"
+        if len(self.first_pair) < 2:
+            self.first_pair.append(line)
+        else:
+            self.recent.append(line)
+        self._text = None
+
+    def clear(self):
+        """Forget the conversation."""
+        self.first_pair.clear()
+        self.recent.clear()
+        self._text = None
+
+    def __bool__(self) -> bool:
+        return bool(self.first_pair)
+
+    @property
+    def text(self) -> str:
+        """History formatted as 'User: ...' / 'Jarvis: ...' lines."""
+        if self._text is None:
+            self._text = "\n".join((*self.first_pair, *self.recent))
+        return self._text
 
 
 class LLMClient:
-    """Groq LLM client with vision support."""
+    """
+    Groq LLM client with vision support.
+
+    A single pooled HTTP/2 connection is kept alive across turns, so only the
+    first request pays the TCP + TLS handshake.
+    """
 
     def __init__(self):
         api_key = os.environ.get("GROQ_API_KEY")
         if not api_key:
             raise ValueError("GROQ_API_KEY environment variable not set")
-        self.client = Groq(api_key=api_key)
+        self.http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300),
+        )
+        self.client = AsyncGroq(api_key=api_key, http_client=self.http_client)
 
-    def get_response(self, query: str, history: list) -> tuple[str, bool]:
+    async def close(self):
+        """Close the pooled HTTP connection."""
+        await self.http_client.aclose()
+
+    async def get_response(self, query: str, history: ConversationContext) -> tuple[str, bool]:
         """Get LLM response. Captures screenshot if 'screenshot' in query."""
-        context = get_context_history(history)
-        if context:
-            history_text = "\n".join(
-                f"{'User' if m['role'] == 'user' else 'Jarvis'}: {m['content']}"
-                for m in context
-            )
-            text_content = f"CONVERSATION HISTORY:\n{history_text}\n\nCURRENT QUERY: {query}"
+        if history:
+            text_content = f"CONVERSATION HISTORY:\n{history.text}\n\nCURRENT QUERY: {query}"
         else:
             text_content = f"CURRENT QUERY: {query}"
 
         if "screenshot" in query.lower():
             print("[LLM] Screenshot requested...")
-            image_b64 = take_screenshot()
+            image_b64 = await asyncio.to_thread(take_screenshot)
             if image_b64:
-                return self._vision_request(query, image_b64)
+                return await self._vision_request(query, image_b64)
             print("[LLM] Screenshot failed, using text model")
 
-        return self._text_request(text_content)
+        return await self._text_request(text_content)
 
-    def _text_request(self, content: str) -> tuple[str, bool]:
+    async def _text_request(self, content: str) -> tuple[str, bool]:
         """Text-only LLM request."""
-        response = self.client.chat.completions.create(
+        response = await self.client.chat.completions.create(
             model=LLM_MODEL,
             messages=[
                 {"role": "system", "content": LLM_SYSTEM_PROMPT},
@@ -148,10 +209,10 @@ class LLMClient:
         text = response.choices[0].message.content.strip()
         return self._parse_response(text)
 
-    def _vision_request(self, query: str, image_b64: str) -> tuple[str, bool]:
+    async def _vision_request(self, query: str, image_b64: str) -> tuple[str, bool]:
         """Two-step: vision model extracts content, text model responds."""
         try:
-            vision_response = self.client.chat.completions.create(
+            vision_response = await self.client.chat.completions.create(
                 model=LLM_VISION_MODEL,
                 messages=[{
                     "role": "user",
@@ -166,7 +227,7 @@ class LLMClient:
             extraction = vision_response.choices[0].message.content.strip()
 
             combined = f"Screenshot content:\n\n{extraction}\n\nUser's question: {query}"
-            text_response = self.client.chat.completions.create(
+            text_response = await self.client.chat.completions.create(
                 model=LLM_MODEL,
                 messages=[
                     {"role": "system", "content": LLM_SYSTEM_PROMPT},
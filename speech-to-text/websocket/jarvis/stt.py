@@ -13,8 +13,8 @@ The WebSocket approach is ideal for STT because:
 
 import asyncio
 import os
-import queue
 import threading
+from collections import deque
 from urllib.parse import urlencode
 
 import pyaudio
@@ -26,6 +26,7 @@ STT_LANGUAGE = "en"
 
 # Customize according to your needs
 CHUNK_SIZE = 1600
+MAX_QUEUED_CHUNKS = 64  # ~6.4s of audio; oldest chunks are dropped on network stalls
 CHANNELS = 1
 FORMAT = pyaudio.paInt16
 
@@ -36,6 +37,8 @@ class STTClient:
     
     Uses a separate thread for audio capture to avoid blocking the async event loop.
     Audio chunks are queued and sent to the WebSocket as fast as the network allows.
+    The queue is bounded: if the network stalls, the oldest audio is dropped so
+    memory stays flat and the transcript stays current.
     """
 
     def __init__(self, language: str = STT_LANGUAGE, sample_rate: int = STT_SAMPLE_RATE):
@@ -45,7 +48,7 @@ class STTClient:
         self.api_key = api_key
         self.language = language
         self.sample_rate = sample_rate
-        self.audio_queue = queue.Queue()
+        self.audio_queue = deque(maxlen=MAX_QUEUED_CHUNKS)
         self.running = False
         self.paused = False
         self.capture_thread = None
@@ -64,7 +67,7 @@ class STTClient:
 
         while self.running:
             try:
-                self.audio_queue.put(stream.read(CHUNK_SIZE, exception_on_overflow=False))
+                self.audio_queue.append(stream.read(CHUNK_SIZE, exception_on_overflow=False))
             except Exception as e:
                 print(f"[Audio Error] {e}")
                 break
@@ -83,7 +86,13 @@ class STTClient:
         url = f"{STT_WS_URL}?{urlencode(params)}"
         headers = {"Authorization": f"Bearer {self.api_key}"}
 
-        self.ws = await websockets.connect(url, additional_headers=headers, open_timeout=30)
+        # permessage-deflate: linear16 PCM (especially silence) compresses well uplink
+        self.ws = await websockets.connect(
+            url,
+            additional_headers=headers,
+            open_timeout=30,
+            compression="deflate",
+        )
         self.running = True
 
         self.capture_thread = threading.Thread(target=self._capture_audio, daemon=True)
@@ -93,13 +102,12 @@ class STTClient:
         """Send audio chunks to STT WebSocket. Skips while paused."""
         while self.running:
             if self.paused:
-                while not self.audio_queue.empty():
-                    self.audio_queue.get_nowait()
+                self.audio_queue.clear()
                 await asyncio.sleep(0.05)
                 continue
 
-            while not self.audio_queue.empty():
-                await self.ws.send(self.audio_queue.get_nowait())
+            while self.audio_queue:
+                await self.ws.send(self.audio_queue.popleft())
             await asyncio.sleep(0.05)
 
     def pause(self):
@@ -112,8 +120,7 @@ class STTClient:
 
     def clear_queue(self):
         """Clear any buffered audio."""
-        while not self.audio_queue.empty():
-            self.audio_queue.get_nowait()
+        self.audio_queue.clear()
 
     async def close(self):
         """Close WebSocket connection."""
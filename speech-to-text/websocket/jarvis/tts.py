@@ -1,35 +1,40 @@
 """
-Lightning TTS HTTP Client
+Lightning TTS WebSocket Client
 
-This module uses the HTTP POST endpoint for text-to-speech. The entire audio
-is generated server-side and returned in one response, then played back locally.
+This module streams text-to-speech over the Lightning WebSocket API. Audio
+chunks are queued for playback as soon as they arrive, so Jarvis starts
+speaking after the first chunk instead of after the whole response has been
+synthesized. The connection is kept open and reused across responses.
 
-For lower latency, you can upgrade to the WebSocket streaming API which delivers
-audio chunks as they're generated. See:
-https://waves-docs.smallest.ai/content/api-references/lightning-v3.1-ws
+See: https://waves-docs.smallest.ai/content/api-references/lightning-v3.1-ws
 """
 
 import asyncio
+import base64
+import json
 import os
-import queue
 import threading
+from collections import deque
 
-import httpx
-import pyaudio
+import sounddevice as sd
+import websockets
 
-TTS_URL = "https://waves-api.smallest.ai/api/v1/lightning-v3.1/get_speech"
+TTS_WS_URL = "wss://waves-api.smallest.ai/api/v1/lightning-v3.1/get_speech/stream"
 TTS_VOICE = "sophia"
 TTS_SAMPLE_RATE = 24000
-PLAYBACK_CHUNK_SIZE = 4800
+# Frame sizes for the start of each response: playback begins after 20 ms of
+# audio, then frames grow so the device buffer builds up against network jitter
+RAMP_MS = (20, 40, 80, 160, 200)
 
 
 class TTSClient:
     """
-    TTS HTTP client with background audio playback.
-    
-    This implementation waits for the complete audio before playback starts.
-    For streaming playback, you would use WebSocket and start playing chunks
-    as they arrive from the server.
+    TTS WebSocket client with background audio playback.
+
+    Each chunk is handed to the playback thread as it arrives, overlapping
+    synthesis with playback. The start of each response is written in
+    RAMP_MS-sized frames: a small first frame for quick time-to-first-audio,
+    then larger ones so early chunks arriving late don't cause gaps.
     """
 
     def __init__(self, voice: str = TTS_VOICE, sample_rate: int = TTS_SAMPLE_RATE):
@@ -39,87 +44,149 @@ class TTSClient:
         self.api_key = api_key
         self.voice = voice
         self.sample_rate = sample_rate
-        self.audio_queue = queue.Queue()
+        self.audio_queue = deque()
+        self.data_ready = threading.Event()
         self.playback_thread = None
-        self.pyaudio_instance = None
         self.audio_stream = None
-        self.stop_playback = False
+        self.idle_write_available = 0
+        self.stop_playback = threading.Event()
+        self.ramp_bytes = [sample_rate * 2 * ms // 1000 for ms in RAMP_MS]
+        self.ramp_step = None  # Index into ramp_bytes, None once ramped up
+        self.ws = None
+        # Request fields that are the same for every response
+        self.request_base = {"voice_id": voice, "sample_rate": sample_rate, "speed": 1.0}
+
+    def _enqueue(self, item):
+        """Hand audio (or an end-of-response marker) to the playback thread."""
+        self.audio_queue.append(item)
+        self.data_ready.set()
 
     def _play_audio(self):
         """Background thread that plays audio from the queue."""
-        while not self.stop_playback:
-            try:
-                data = self.audio_queue.get(timeout=0.1)
-                if data is None:
-                    break
-                self.audio_stream.write(data)
-            except queue.Empty:
-                continue
+        pending = bytearray()
+        while not self.stop_playback.is_set():
+            self.data_ready.wait()
+            # Clear before draining so an append during the drain re-arms the event
+            self.data_ready.clear()
+
+            while self.audio_queue and not self.stop_playback.is_set():
+                data = self.audio_queue.popleft()
+
+                if isinstance(data, bytes):
+                    if self.ramp_step is None:
+                        self.audio_stream.write(data)
+                        continue
+
+                    pending += data
+                    while len(pending) >= self.ramp_bytes[self.ramp_step]:
+                        size = self.ramp_bytes[self.ramp_step]
+                        frame = pending[:size]
+                        del pending[:size]
+                        self.audio_stream.write(frame)
+
+                        self.ramp_step += 1
+                        if self.ramp_step == len(self.ramp_bytes):
+                            self.ramp_step = None
+                            # RawOutputStream takes any buffer, so hand over
+                            # the bytearray itself rather than a bytes() copy
+                            if pending:
+                                self.audio_stream.write(pending)
+                                pending = bytearray()
+                            break
+                else:
+                    # End of response: play anything still ramping (short
+                    # replies), then wake the speak() call waiting on it
+                    if pending:
+                        self.audio_stream.write(pending)
+                        pending = bytearray()
+                    self.ramp_step = None
+                    loop, done = data
+                    loop.call_soon_threadsafe(done.set)
 
     def start(self):
         """Initialize audio playback."""
-        self.pyaudio_instance = pyaudio.PyAudio()
-        self.audio_stream = self.pyaudio_instance.open(
-            format=pyaudio.paInt16,
+        # Blocking writes wait inside PortAudio's C code, not in Python, and
+        # latency="high" gives the device a deeper buffer against glitches
+        self.audio_stream = sd.RawOutputStream(
+            samplerate=self.sample_rate,
             channels=1,
-            rate=self.sample_rate,
-            output=True,
+            dtype="int16",
+            blocksize=2048,
+            latency="high",
         )
+        self.audio_stream.start()
+        # Free space in the device buffer when nothing is queued; used to detect drain
+        self.idle_write_available = self.audio_stream.write_available
 
-        self.stop_playback = False
+        self.stop_playback.clear()
         self.playback_thread = threading.Thread(target=self._play_audio, daemon=True)
         self.playback_thread.start()
 
+    async def connect(self):
+        """Open the TTS WebSocket. The connection is reused across speak() calls."""
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        self.ws = await websockets.connect(TTS_WS_URL, additional_headers=headers, open_timeout=30)
+
     async def speak(self, text: str):
-        """
-        Convert text to speech and play it.
-        
-        With HTTP POST, we wait for the full audio before playback begins.
-        With WebSocket streaming, you could start playback as soon as the
-        first audio chunk arrives, reducing perceived latency.
-        """
+        """Convert text to speech and play it, starting with the first chunk."""
         if not text.strip():
             return
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-        payload = {
-            "text": text,
-            "voice_id": self.voice,
-            "sample_rate": self.sample_rate,
-            "speed": 1.0,
-            "language": "en",
-            "output_format": "pcm",
-        }
-
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(TTS_URL, headers=headers, json=payload)
-
-            if response.status_code != 200:
-                print(f"[TTS ERROR] {response.status_code}: {response.text}")
-                return
-
-            audio_bytes = response.content
-
-            # Feed audio to playback thread in chunks to avoid buffer issues
-            for i in range(0, len(audio_bytes), PLAYBACK_CHUNK_SIZE):
-                self.audio_queue.put(audio_bytes[i:i + PLAYBACK_CHUNK_SIZE])
-
-        while not self.audio_queue.empty():
-            await asyncio.sleep(0.1)
-        await asyncio.sleep(0.2)
+        request = json.dumps({"text": text, **self.request_base})
+
+        done = asyncio.Event()
+        self.ramp_step = 0
+        if self.ws is None:
+            await self.connect()
+        try:
+            await self.ws.send(request)
+        except websockets.ConnectionClosed:
+            # The server closes idle connections; reconnect once and retry
+            await self.connect()
+            await self.ws.send(request)
+
+        try:
+            async for message in self.ws:
+                data = json.loads(message)
+                status = data.get("status")
+
+                if status == "chunk":
+                    self._enqueue(base64.b64decode(data["data"]["audio"]))
+                elif status == "complete":
+                    break
+                elif status == "error":
+                    print(f"[TTS ERROR] {data.get('error', data)}")
+                    break
+        except BaseException:
+            # Don't leave a half-read response on the shared connection
+            await self.close()
+            raise
+        finally:
+            self._enqueue((asyncio.get_running_loop(), done))
+
+        await done.wait()
+        await self._wait_for_device_drain()
+
+    async def _wait_for_device_drain(self):
+        """Wait until the device buffer has played out, at most one output latency."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.audio_stream.latency
+        while self.audio_stream.write_available < self.idle_write_available and loop.time() < deadline:
+            await asyncio.sleep(0.005)
 
     def stop(self):
-        """Stop playback and clean up resources."""
-        self.stop_playback = True
-        self.audio_queue.put(None)
+        """Stop playback and clean up audio resources."""
+        self.stop_playback.set()
+        self.data_ready.set()
 
         if self.playback_thread:
             self.playback_thread.join(timeout=2.0)
         if self.audio_stream:
-            self.audio_stream.stop_stream()
+            self.audio_stream.abort()
             self.audio_stream.close()
-        if self.pyaudio_instance:
-            self.pyaudio_instance.terminate()
+
+    async def close(self):
+        """Close the WebSocket connection."""
+        if self.ws:
+            await self.ws.close()
+            self.ws = None
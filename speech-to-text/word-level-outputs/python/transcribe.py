@@ -30,23 +30,22 @@ DIARIZE = True
 
 
 def transcribe(audio_file: str, api_key: str) -> dict:
+    # Pass the open file so requests streams it instead of loading it into memory
     with open(audio_file, "rb") as f:
-        audio_data = f.read()
-
-    response = requests.post(
-        API_URL,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/octet-stream",
-        },
-        params={
-            "language": LANGUAGE,
-            "word_timestamps": str(WORD_TIMESTAMPS).lower(),
-            "diarize": str(DIARIZE).lower(),
-        },
-        data=audio_data,
-        timeout=300,
-    )
+        response = requests.post(
+            API_URL,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/octet-stream",
+            },
+            params={
+                "language": LANGUAGE,
+                "word_timestamps": str(WORD_TIMESTAMPS).lower(),
+                "diarize": str(DIARIZE).lower(),
+            },
+            data=f,
+            timeout=300,
+        )
 
     if response.status_code != 200:
         raise Exception(f"API request failed with status {response.status_code}: {response.text}")
@@ -1,5 +1,6 @@
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from groq import Groq
 from dotenv import load_dotenv
 
@@ -7,19 +8,67 @@ load_dotenv()
 
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 
+# Transcripts longer than this are summarized section by section first (map-reduce)
+SECTION_CHARS = 15000
+MAX_PARALLEL_SECTIONS = 8
+
 def get_groq():
     if not GROQ_API_KEY: return None
     return Groq(api_key=GROQ_API_KEY)
 
+def split_transcript(text, max_chars=SECTION_CHARS):
+    """Split text into sections of at most ~max_chars, on sentence boundaries."""
+    sections, current = [], []
+    size = 0
+    for sentence in text.replace(". ", ".\n").split("\n"):
+        if size + len(sentence) > max_chars and current:
+            sections.append(" ".join(current))
+            current, size = [], 0
+        current.append(sentence)
+        size += len(sentence) + 1
+    if current:
+        sections.append(" ".join(current))
+    return sections
+
+def summarize_section(client, section):
+    """Condense one transcript section into dense notes (map step)."""
+    resp = client.chat.completions.create(
+        messages=[{"role": "user", "content": f"Summarize this section of a video transcript as dense notes. Keep every key point and fact.\n\n{section}"}],
+        model="openai/gpt-oss-120b",
+    )
+    return resp.choices[0].message.content
+
+def condense(client, text):
+    """Summarize sections in parallel, then the notes again, until they fit in one prompt."""
+    while len(text) > SECTION_CHARS:
+        sections = split_transcript(text)
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_SECTIONS) as pool:
+            notes = "\n\n".join(pool.map(lambda section: summarize_section(client, section), sections))
+        if len(notes) >= len(text):
+            print(f"[Analysis] Notes stopped getting shorter, using the first {SECTION_CHARS} characters")
+            return notes[:SECTION_CHARS]
+        text = notes
+    return text
+
 def analyze_transcript(text):
     """Send transcript to Groq for summarization."""
     client = get_groq()
     if not client: return None
     
+    # Long videos are summarized from section notes instead of the raw transcript
+    label = "Transcript"
+    if len(text) > SECTION_CHARS:
+        try:
+            text = condense(client, text)
+            label = "Notes from each section of the transcript"
+        except Exception as e:
+            print(f"[Analysis] Section summaries failed, using the first {SECTION_CHARS} characters: {e}")
+            text = text[:SECTION_CHARS]
+    
     prompt = f"""
     Summarize this YouTube video transcript.
     
-    Transcript Snippet: "{text[:15000]}"
+    {label}: "{text}"
     
     Return JSON with:
     1. 'summary': A punchy 3-sentence summary.
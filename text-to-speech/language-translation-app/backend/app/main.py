@@ -11,7 +11,7 @@ from .config import SOURCE_LANGUAGES, TARGET_LANGUAGES, SPEECH_LANGUAGES
 from .translator import translate_text
 from .tts import synthesize_speech
 from .stt import transcribe_audio, close_stt_client
-from .tts import get_voices
+from .tts import get_voices, close_tts_client
 from .database import init_db, add_to_history, get_history, delete_history_item
 
 
@@ -20,6 +20,7 @@ async def lifespan(app: FastAPI):
     await init_db()
     yield
     await close_stt_client()
+    close_tts_client()
 
 
 app = FastAPI(title="Langly", lifespan=lifespan)
@@ -1,4 +1,5 @@
 """Smallest.ai Lightning TTS - v3.1 for en/hi/ta/es, v2 for other languages."""
+import threading
 import httpx
 from typing import Optional
 
@@ -34,6 +35,30 @@ V2_VOICES_URLS = [
     "https://api.smallest.ai/waves/v1/lightning-v2/get_voices",
 ]
 
+# Reused client: keep-alive plus HTTP/2, so concurrent TTS requests (run from the
+# executor threads) multiplex over pooled connections
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+            )
+        return _client
+
+
+def close_tts_client() -> None:
+    """Close the shared HTTP client. Call on app shutdown."""
+    global _client
+    with _client_lock:
+        if _client and not _client.is_closed:
+            _client.close()
+        _client = None
 
 
 def _fetch_raw_voices(urls: list) -> list:
@@ -41,12 +66,12 @@ def _fetch_raw_voices(urls: list) -> list:
     if not SMALLEST_API_KEY:
         return []
     headers = {"Authorization": f"Bearer {SMALLEST_API_KEY}"}
+    client = _get_client()
     for url in urls:
         try:
-            with httpx.Client(timeout=10.0) as client:
-                r = client.get(url, headers=headers)
-                if r.status_code == 200:
-                    return r.json().get("voices", [])
+            r = client.get(url, headers=headers, timeout=10.0)
+            if r.status_code == 200:
+                return r.json().get("voices", [])
         except Exception:
             continue
     return []
@@ -136,24 +161,24 @@ def synthesize_speech(
         "Content-Type": "application/json",
     }
     last_error = None
+    client = _get_client()
     for tts_url in urls:
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(tts_url, json=payload, headers=headers)
-                if response.status_code == 400:
-                    valid_voice = _get_valid_voice(lang or "en", use_v31)
-                    if valid_voice != voice:
-                        payload["voice_id"] = valid_voice
-                        response = client.post(tts_url, json=payload, headers=headers)
-                if response.status_code == 200:
-                    return response.content
-                err = response.text
-                try:
-                    j = response.json()
-                    err = j.get("message", j.get("error", err))
-                except Exception:
-                    pass
-                last_error = err
+            response = client.post(tts_url, json=payload, headers=headers, timeout=30.0)
+            if response.status_code == 400:
+                valid_voice = _get_valid_voice(lang or "en", use_v31)
+                if valid_voice != voice:
+                    payload["voice_id"] = valid_voice
+                    response = client.post(tts_url, json=payload, headers=headers, timeout=30.0)
+            if response.status_code == 200:
+                return response.content
+            err = response.text
+            try:
+                j = response.json()
+                err = j.get("message", j.get("error", err))
+            except Exception:
+                pass
+            last_error = err
         except httpx.HTTPError as e:
             last_error = str(e)
     raise ValueError(last_error or "TTS request failed")
@@ -7,18 +7,81 @@ Usage:
     python export_transcripts.py --output transcripts.txt
     python export_transcripts.py --agent <agent_id> --output transcripts.txt
     python export_transcripts.py --limit 50 --output transcripts.json
+    python export_transcripts.py --output transcripts.json --compress  # writes transcripts.json.zst
+
+Details of finished calls are cached in <output>.cache.jsonl, so re-running an
+export only fetches calls that weren't exported before. Use --refresh to
+re-fetch all.
 """
 
 import os
 import sys
-import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import orjson
 from dotenv import load_dotenv
 from smallestai.atoms import Call
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 load_dotenv()
 
+# Max call detail requests in flight at once
+MAX_CONCURRENT_FETCHES = 16
+
+# Calls in these states have ended, so their details can be cached
+FINAL_STATUSES = {"completed", "failed"}
+
+
+def fetch_transcript(call, call_id):
+    """Fetch one call's details and extract the fields we export."""
+    details = call.get_call(call_id)
+    data = details.get("data", {})
+
+    return {
+        "call_id": call_id,
+        "date": data.get("createdAt", ""),
+        "duration": data.get("duration", 0),
+        "from": data.get("from", ""),
+        "to": data.get("to", ""),
+        "transcript": data.get("transcript", []),
+        "summary": data.get("postCallAnalytics", {}).get("summary", "")
+    }
+
+
+def load_cache(cache_path):
+    """Load previously fetched call records, keyed by call ID."""
+    if not os.path.exists(cache_path):
+        return {}
+    with open(cache_path, "rb") as f:
+        return {row["call_id"]: row for row in map(orjson.loads, f)}
+
+
+def is_final(status, record):
+    """Whether a call's details won't change: it has ended, and if it completed, its summary exists."""
+    if status == "completed":
+        return bool(record["summary"])
+    return status in FINAL_STATUSES
+
+
+def save_cache(cache_path, rows):
+    """Rewrite the cache with the given call records, one JSON object per line."""
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.writelines(orjson.dumps(row) + b"\n" for row in rows)
+    os.replace(tmp_path, cache_path)
+
+
+def open_output(path, mode):
+    """Open the export file, writing a zstd stream if the name ends in .zst."""
+    if path.endswith(".zst"):
+        return zstandard.open(path, mode, cctx=zstandard.ZstdCompressor(level=3))
+    return open(path, mode, buffering=1 << 20)
+
 
 def main():
     """Export transcripts to a file."""
@@ -30,9 +93,15 @@ def main():
     parser.add_argument("--limit", type=int, default=20, help="Number of calls to export (default: 20)")
     parser.add_argument("--output", required=True, help="Output file path")
     parser.add_argument("--format", choices=["txt", "json"], default="txt", help="Output format")
+    parser.add_argument("--compress", action="store_true", help="Write zstd-compressed output (adds .zst)")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached call details and re-fetch")
     
     args = parser.parse_args()
     
+    if args.compress and zstandard is None:
+        print("Error: zstandard package not installed. Run: pip install zstandard")
+        sys.exit(1)
+    
     call = Call()
     
     print(f"Fetching up to {args.limit} calls...")
@@ -51,59 +120,68 @@ def main():
         print("No calls found.")
         return
     
-    print(f"Found {len(calls)} calls. Fetching transcripts...")
-    
-    transcripts = []
-    
-    for i, c in enumerate(calls):
-        call_id = c.get("callId")
-        if not call_id:
-            continue
-        
-        # Get full call details
-        details = call.get_call(call_id)
-        data = details.get("data", {})
-        
-        transcript = data.get("transcript", [])
-        
-        transcripts.append({
-            "call_id": call_id,
-            "date": data.get("createdAt", ""),
-            "duration": data.get("duration", 0),
-            "from": data.get("from", ""),
-            "to": data.get("to", ""),
-            "transcript": transcript,
-            "summary": data.get("postCallAnalytics", {}).get("summary", "")
-        })
-        
-        print(f"  [{i+1}/{len(calls)}] {call_id}")
+    statuses = {c["callId"]: c.get("status") for c in calls if c.get("callId")}
+    call_ids = list(statuses)
+    
+    # Only fetch details for calls not already in the cache
+    cache_path = f"{args.output}.cache.jsonl"
+    cached = load_cache(cache_path)
+    new_ids = call_ids if args.refresh else [call_id for call_id in call_ids if call_id not in cached]
+    
+    print(f"Found {len(calls)} calls ({len(call_ids) - len(new_ids)} cached). Fetching transcripts...")
+    
+    # Fetch call details concurrently
+    fetched = {}
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as pool:
+        results = pool.map(lambda call_id: fetch_transcript(call, call_id), new_ids)
+        for i, t in enumerate(results):
+            fetched[t["call_id"]] = t
+            print(f"  [{i+1}/{len(new_ids)}] {t['call_id']}")
+    
+    transcripts = [fetched.get(call_id) or cached[call_id] for call_id in call_ids]
+    
+    # Re-fetched calls replace their old rows. Calls still in progress or
+    # still waiting for their summary aren't cached, so they're fetched again
+    # next time instead of staying stale.
+    if fetched:
+        for call_id, t in fetched.items():
+            cached.pop(call_id, None)
+            if is_final(statuses[call_id], t):
+                cached[call_id] = t
+        save_cache(cache_path, cached.values())
     
     # Write output
     output_path = args.output
+    as_json = args.format == "json" or output_path.endswith(".json")
+    if args.compress:
+        output_path += ".zst"
     
-    if args.format == "json" or output_path.endswith(".json"):
-        with open(output_path, "w") as f:
-            json.dump(transcripts, f, indent=2)
+    if as_json:
+        with open_output(output_path, "wb") as f:
+            f.write(orjson.dumps(transcripts, option=orjson.OPT_INDENT_2))
     else:
-        with open(output_path, "w") as f:
+        with open_output(output_path, "w") as f:
             for t in transcripts:
-                f.write("=" * 60 + "\n")
-                f.write(f"Call ID: {t['call_id']}\n")
-                f.write(f"Date: {t['date']}\n")
-                f.write(f"Duration: {t['duration']}s\n")
-                f.write(f"From: {t['from']} -> To: {t['to']}\n")
-                f.write("-" * 60 + "\n")
-                
-                for entry in t["transcript"]:
-                    role = "Agent" if entry.get("role") == "agent" else "User"
-                    content = entry.get("content", "")
-                    f.write(f"{role}: {content}\n")
+                # Build each call's block, then write it in one call
+                lines = [
+                    "=" * 60 + "\n",
+                    f"Call ID: {t['call_id']}\n",
+                    f"Date: {t['date']}\n",
+                    f"Duration: {t['duration']}s\n",
+                    f"From: {t['from']} -> To: {t['to']}\n",
+                    "-" * 60 + "\n",
+                ]
+                lines += [
+                    f"{'Agent' if entry.get('role') == 'agent' else 'User'}: {entry.get('content', '')}\n"
+                    for entry in t["transcript"]
+                ]
                 
                 if t["summary"]:
-                    f.write("-" * 60 + "\n")
-                    f.write(f"Summary: {t['summary']}\n")
+                    lines.append("-" * 60 + "\n")
+                    lines.append(f"Summary: {t['summary']}\n")
                 
-                f.write("\n")
+                lines.append("\n")
+                f.writelines(lines)
     
     print(f"\n✓ Exported {len(transcripts)} transcripts to {output_path}")
 
@@ -13,13 +13,33 @@ Usage:
 import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from dotenv import load_dotenv
 from smallestai.atoms import Call
 
 load_dotenv()
 
+# Larger --limit values are split into pages of this size and fetched in parallel
+PAGE_SIZE = 100
+MAX_CONCURRENT_PAGES = 8
 
+SEPARATOR = "-" * 80 + "\n"
+CALL_TEMPLATE = (
+    "Call ID:   {call_id}\n"
+    "Status:    {status}\n"
+    "Type:      {call_type}\n"
+    "Duration:  {duration}\n"
+    "From:      {from_num}\n"
+    "To:        {to_num}\n"
+    "Date:      {created}\n"
+) + SEPARATOR
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
+
+
+@lru_cache(maxsize=1024)
 def format_duration(seconds):
     """Format duration in human-readable format."""
     if not seconds:
@@ -29,17 +49,50 @@ def format_duration(seconds):
     return f"{minutes}m {secs}s"
 
 
+@lru_cache(maxsize=4096)
 def format_timestamp(timestamp_str):
     """Format timestamp for display."""
     if not timestamp_str:
         return "N/A"
     try:
         dt = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        return dt.strftime("%Y-%m-%d %H:%M")
+        return dt.strftime(TIMESTAMP_FORMAT)
     except:
         return timestamp_str[:16]
 
 
+def fetch_calls(call, filters, limit, page):
+    """Fetch one page of `limit` calls, returning (calls, total)."""
+    if limit <= PAGE_SIZE:
+        data = call.get_calls(**filters, limit=limit, page=page).get("data", {})
+        calls = data.get("logs", [])
+        return calls, data.get("pagination", {}).get("total", len(calls))
+
+    # Map the requested window onto API pages of PAGE_SIZE
+    start = (page - 1) * limit
+    first_page = start // PAGE_SIZE + 1
+    last_page = (start + limit - 1) // PAGE_SIZE + 1
+
+    # The first response tells us the total, so we don't request empty pages
+    data = call.get_calls(**filters, limit=PAGE_SIZE, page=first_page).get("data", {})
+    calls = data.get("logs", [])
+    total = data.get("pagination", {}).get("total")
+    if total is not None:
+        last_page = min(last_page, -(-total // PAGE_SIZE))
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGES) as pool:
+        pages = pool.map(
+            lambda p: call.get_calls(**filters, limit=PAGE_SIZE, page=p),
+            range(first_page + 1, last_page + 1),
+        )
+        for result in pages:
+            calls += result.get("data", {}).get("logs", [])
+
+    offset = start - (first_page - 1) * PAGE_SIZE
+    calls = calls[offset:offset + limit]
+    return calls, len(calls) if total is None else total
+
+
 def main():
     """Get and display call logs."""
     
@@ -58,43 +111,36 @@ def main():
     
     print("Fetching call logs...")
     
-    result = call.get_calls(
-        agent_id=args.agent,
-        campaign_id=args.campaign,
-        status=args.status,
-        call_type=args.type,
-        search=args.search,
-        limit=args.limit,
-        page=args.page
-    )
-    
-    calls = result.get("data", {}).get("logs", [])
-    total = result.get("data", {}).get("pagination", {}).get("total", len(calls))
+    filters = {
+        "agent_id": args.agent,
+        "campaign_id": args.campaign,
+        "status": args.status,
+        "call_type": args.type,
+        "search": args.search,
+    }
+    calls, total = fetch_calls(call, filters, args.limit, args.page)
     
     if not calls:
         print("No calls found.")
         return
     
     print(f"\nShowing {len(calls)} of {total} calls (page {args.page}):\n")
-    print("-" * 80)
     
-    for c in calls:
-        call_id = c.get("callId", "N/A")
-        status = c.get("status", "N/A")
-        duration = format_duration(c.get("duration"))
-        call_type = c.get("type", "N/A")
-        from_num = c.get("from", "N/A")
-        to_num = c.get("to", "N/A")
-        created = format_timestamp(c.get("createdAt"))
-        
-        print(f"Call ID:   {call_id}")
-        print(f"Status:    {status}")
-        print(f"Type:      {call_type}")
-        print(f"Duration:  {duration}")
-        print(f"From:      {from_num}")
-        print(f"To:        {to_num}")
-        print(f"Date:      {created}")
-        print("-" * 80)
+    # Format every call first, then write the listing in one go
+    blocks = [
+        CALL_TEMPLATE.format(
+            call_id=c.get("callId", "N/A"),
+            status=c.get("status", "N/A"),
+            call_type=c.get("type", "N/A"),
+            duration=format_duration(c.get("duration")),
+            from_num=c.get("from", "N/A"),
+            to_num=c.get("to", "N/A"),
+            created=format_timestamp(c.get("createdAt")),
+        )
+        for c in calls
+    ]
+    sys.stdout.write(SEPARATOR + "".join(blocks))
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -43,7 +43,11 @@ async def setup_session(session: AgentSession):
             support_agent.context.add_message({"role": "assistant", "content": greeting})
             await support_agent.speak(greeting)
 
-    await session.wait_until_complete()
+    try:
+        await session.wait_until_complete()
+    finally:
+        # Don't leave the analyzer's batch task running after the call ends
+        await sentiment_analyzer.close()
     
     # Log final sentiment summary
     summary = sentiment_analyzer.get_sentiment_summary()
@@ -1,7 +1,10 @@
 """Background agent for real-time sentiment analysis."""
 
+import asyncio
 import os
-from typing import Dict, List
+import re
+from collections import Counter, OrderedDict, deque
+from typing import Deque, Dict, List, Optional
 
 from dotenv import load_dotenv
 from loguru import logger
@@ -17,6 +20,76 @@ from smallestai.atoms.agent.nodes import BackgroundAgentNode
 
 load_dotenv()
 
+SENTIMENTS = ["positive", "neutral", "negative", "frustrated"]
+
+SENTIMENT_PROMPT = """\
+Analyze the sentiment of this customer message.
+Respond with exactly one word: positive, neutral, negative, or frustrated.
+Only respond with that single word.\
+"""
+
+BATCH_SENTIMENT_PROMPT = """\
+Analyze the sentiment of each numbered customer message.
+Respond with exactly {count} lines, one per message, in order.
+Each line must be exactly one word: positive, neutral, negative, or frustrated.\
+"""
+
+# Messages arriving within this window are classified in one LLM call
+BATCH_WINDOW_SECONDS = 0.15
+MAX_BATCH_SIZE = 8
+
+
+# Bounds memory on long calls
+MAX_HISTORY = 200
+
+# Unambiguous wording is classified locally
+FRUSTRATED_RE = re.compile(
+    r"\b(angry|furious|ridiculous|useless|hate|worst|fed up|damn|wtf|stupid|frustrat\w*)\b", re.I
+)
+NEGATIVE_RE = re.compile(r"\b(disappointed|unhappy|annoyed|upset)\b", re.I)
+POSITIVE_RE = re.compile(r"\b(thank(s| you)|great|awesome|perfect|love it|appreciate)\b", re.I)
+# "not great" or "not upset" flips the keyword, leave those to the LLM
+NEGATION_RE = re.compile(r"\b(not|no|never)\b|n't\b", re.I)
+
+# Short replies like "yes" or "thanks" repeat a lot, cache their sentiment
+MAX_CACHE_SIZE = 512
+MAX_CACHED_TEXT_LENGTH = 200
+
+
+def _cache_key(text: str) -> str:
+    """Normalize case and whitespace so repeated phrases share a cache entry."""
+    return " ".join(text.lower().split())[:128]
+
+
+def _keyword_sentiment(text: str) -> Optional[str]:
+    """Return a sentiment for messages with obvious keywords, else None.
+
+    Negated or mixed wording ("I hate to bother you, thanks") is ambiguous
+    and returns None, so the LLM classifies it.
+    """
+    if NEGATION_RE.search(text):
+        return None
+
+    frustrated = FRUSTRATED_RE.search(text)
+    negative = NEGATIVE_RE.search(text)
+    positive = POSITIVE_RE.search(text)
+    if positive and (frustrated or negative):
+        return None
+
+    if frustrated:
+        return "frustrated"
+    if negative:
+        return "negative"
+    if positive:
+        return "positive"
+    return None
+
+
+def _parse_sentiment(reply: str) -> str:
+    """Normalize a model reply to a known sentiment label."""
+    sentiment = reply.strip().strip(".").lower()
+    return sentiment if sentiment in SENTIMENTS else "neutral"
+
 
 class SentimentAnalyzer(BackgroundAgentNode):
     """Analyzes user sentiment in real-time without producing output.
@@ -40,14 +113,22 @@ class SentimentAnalyzer(BackgroundAgentNode):
             api_key=os.getenv("OPENAI_API_KEY")
         )
         
-        # Store sentiment history
-        self.sentiment_history: List[Dict] = []
+        # Store recent sentiment history, overall counts cover the whole call
+        self.sentiment_history: Deque[Dict] = deque(maxlen=MAX_HISTORY)
+        self.sentiment_counts: Counter = Counter()
         self.current_sentiment: str = "neutral"
         self.frustration_count: int = 0
         
         # Track speaking state
         self.user_is_speaking: bool = False
 
+        # User messages waiting to be classified, drained in batches
+        self._pending: asyncio.Queue = asyncio.Queue()
+        self._batch_task = None
+
+        # Sentiment of recently seen short messages, least recently used first
+        self._cache: OrderedDict[str, str] = OrderedDict()
+
     async def process_event(self, event: SDKEvent):
         """Process events in the background.
         
@@ -67,53 +148,135 @@ class SentimentAnalyzer(BackgroundAgentNode):
         # Analyze sentiment when we get user transcripts
         elif isinstance(event, SDKAgentTranscriptUpdateEvent):
             if event.role == "user":
-                await self._analyze_sentiment(event.content)
+                self._queue_sentiment(event.content)
+
+    def _queue_sentiment(self, text: str):
+        """Queue a user message for the next classification batch."""
+        if self._batch_task is None:
+            self._batch_task = asyncio.create_task(self._classify_batches())
+        self._pending.put_nowait(text)
 
-    async def _analyze_sentiment(self, text: str):
-        """Analyze sentiment of user message."""
+    async def close(self):
+        """Stop the batch task once the session is over."""
+        if self._batch_task is None:
+            return
+        self._batch_task.cancel()
         try:
-            response = await self.llm.chat(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """Analyze the sentiment of this customer message.
-Respond with exactly one word: positive, neutral, negative, or frustrated.
-Only respond with that single word."""
-                    },
-                    {"role": "user", "content": text}
-                ],
-                stream=False
+            await self._batch_task
+        except asyncio.CancelledError:
+            pass
+        self._batch_task = None
+
+    async def _classify_batches(self):
+        """Classify queued messages in batches, one LLM call per batch."""
+        loop = asyncio.get_running_loop()
+        while True:
+            text = await self._pending.get()
+            known = self._known_sentiment(text)
+            if known is not None and self._pending.empty():
+                # Nothing to batch with, skip the wait
+                self._record_sentiment(text, known)
+                continue
+
+            batch = [text]
+            deadline = loop.time() + BATCH_WINDOW_SECONDS
+            while len(batch) < MAX_BATCH_SIZE:
+                try:
+                    batch.append(await asyncio.wait_for(
+                        self._pending.get(), timeout=max(0, deadline - loop.time())
+                    ))
+                except asyncio.TimeoutError:
+                    break
+
+            sentiments = [self._known_sentiment(text) for text in batch]
+            uncached = [text for text, sentiment in zip(batch, sentiments) if sentiment is None]
+            if uncached:
+                try:
+                    classified = iter(await self._analyze_batch(uncached))
+                except Exception as e:
+                    logger.error(f"[SentimentAnalyzer] Analysis failed: {e}")
+                    continue
+                sentiments = [sentiment or next(classified) for sentiment in sentiments]
+
+            for text, sentiment in zip(batch, sentiments):
+                self._cache_sentiment(text, sentiment)
+                self._record_sentiment(text, sentiment)
+
+    def _known_sentiment(self, text: str) -> Optional[str]:
+        """Classify without the LLM when keywords or the cache decide it."""
+        return _keyword_sentiment(text) or self._cached_sentiment(text)
+
+    def _cached_sentiment(self, text: str) -> Optional[str]:
+        """Return the cached sentiment for a repeated phrase, if any."""
+        key = _cache_key(text)
+        if key not in self._cache:
+            return None
+        self._cache.move_to_end(key)
+        return self._cache[key]
+
+    def _cache_sentiment(self, text: str, sentiment: str):
+        """Remember the sentiment of a short message."""
+        if len(text) > MAX_CACHED_TEXT_LENGTH:
+            return
+        self._cache[_cache_key(text)] = sentiment
+        if len(self._cache) > MAX_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    async def _analyze_batch(self, texts: List[str]) -> List[str]:
+        """Classify several messages with a single request."""
+        if len(texts) == 1:
+            return [await self._analyze_sentiment(texts[0])]
+
+        numbered = "\n".join(f"{i}. {' '.join(text.split())}" for i, text in enumerate(texts, 1))
+        response = await self.llm.chat(
+            messages=[
+                {"role": "system", "content": BATCH_SENTIMENT_PROMPT.format(count=len(texts))},
+                {"role": "user", "content": numbered}
+            ],
+            stream=False
+        )
+
+        lines = [line.strip() for line in response.content.strip().splitlines() if line.strip()]
+        if len(lines) != len(texts):
+            # Model didn't follow the format, classify one by one instead
+            return list(await asyncio.gather(*(self._analyze_sentiment(t) for t in texts)))
+
+        # Tolerate "1. positive" style numbering in the reply
+        return [_parse_sentiment(line.split()[-1]) for line in lines]
+
+    async def _analyze_sentiment(self, text: str) -> str:
+        """Analyze sentiment of a single user message."""
+        response = await self.llm.chat(
+            messages=[
+                {"role": "system", "content": SENTIMENT_PROMPT},
+                {"role": "user", "content": text}
+            ],
+            stream=False
+        )
+        return _parse_sentiment(response.content)
+
+    def _record_sentiment(self, text: str, sentiment: str):
+        """Update sentiment state with a classified message."""
+        self.current_sentiment = sentiment
+        self.sentiment_history.append({
+            "text": text,
+            "sentiment": sentiment
+        })
+        self.sentiment_counts[sentiment] += 1
+
+        # Track frustration for escalation
+        if sentiment in ["negative", "frustrated"]:
+            self.frustration_count += 1
+            logger.warning(
+                f"[SentimentAnalyzer] Detected {sentiment} sentiment "
+                f"(frustration count: {self.frustration_count})"
             )
-            
-            sentiment = response.content.strip().lower()
-            
-            # Validate response
-            if sentiment not in ["positive", "neutral", "negative", "frustrated"]:
-                sentiment = "neutral"
-            
-            # Update state
-            self.current_sentiment = sentiment
-            self.sentiment_history.append({
-                "text": text,
-                "sentiment": sentiment
-            })
-            
-            # Track frustration for escalation
-            if sentiment in ["negative", "frustrated"]:
-                self.frustration_count += 1
-                logger.warning(
-                    f"[SentimentAnalyzer] Detected {sentiment} sentiment "
-                    f"(frustration count: {self.frustration_count})"
-                )
-            else:
-                # Reset on positive interaction
-                if sentiment == "positive":
-                    self.frustration_count = max(0, self.frustration_count - 1)
-                    
-            logger.info(f"[SentimentAnalyzer] Sentiment: {sentiment}")
-            
-        except Exception as e:
-            logger.error(f"[SentimentAnalyzer] Analysis failed: {e}")
+        else:
+            # Reset on positive interaction
+            if sentiment == "positive":
+                self.frustration_count = max(0, self.frustration_count - 1)
+
+        logger.info(f"[SentimentAnalyzer] Sentiment: {sentiment}")
 
     def should_escalate(self) -> bool:
         """Check if the call should be escalated based on sentiment."""
@@ -124,17 +287,13 @@ Only respond with that single word."""
         if not self.sentiment_history:
             return {"overall": "neutral", "history": []}
             
-        sentiments = [s["sentiment"] for s in self.sentiment_history]
-        
         # Simple majority sentiment
-        from collections import Counter
-        counts = Counter(sentiments)
-        overall = counts.most_common(1)[0][0]
+        overall = self.sentiment_counts.most_common(1)[0][0]
         
         return {
             "overall": overall,
             "current": self.current_sentiment,
             "frustration_count": self.frustration_count,
             "should_escalate": self.should_escalate(),
-            "history": self.sentiment_history[-5:]  # Last 5 entries
+            "history": list(self.sentiment_history)[-5:]  # Last 5 entries
         }
@@ -1,5 +1,6 @@
 """Main support agent that works alongside the sentiment analyzer."""
 
+import json
 import os
 from typing import TYPE_CHECKING, List
 
@@ -16,6 +17,25 @@ if TYPE_CHECKING:
 
 load_dotenv()
 
+# Tools whose result is the whole reply: end_call hangs up, and
+# transfer_to_supervisor returns the sentence to say to the caller
+FINAL_TOOLS = {"end_call", "transfer_to_supervisor"}
+
+SYSTEM_PROMPT = """\
+You are a helpful customer support agent.
+
+You have tools to:
+- Check the current customer sentiment (use this to adapt your tone)
+- Check if escalation is needed
+- End the call
+- Transfer to a supervisor
+
+IMPORTANT: Be extra empathetic if sentiment is negative or frustrated.
+If the customer seems very upset, proactively offer to transfer to a supervisor.
+
+Keep responses concise and helpful.\
+"""
+
 
 class SupportAgent(OutputAgentNode):
     """Support agent with access to background sentiment analysis.
@@ -26,6 +46,8 @@ class SupportAgent(OutputAgentNode):
     - Auto-escalation based on sentiment
     """
 
+    _tool_schemas = None
+
     def __init__(self, sentiment_analyzer: "SentimentAnalyzer"):
         super().__init__(name="support-agent")
         
@@ -41,23 +63,12 @@ class SupportAgent(OutputAgentNode):
         # Initialize tools
         self.tool_registry = ToolRegistry()
         self.tool_registry.discover(self)
-        self.tool_schemas = self.tool_registry.get_schemas()
-
-        self.context.add_message({
-            "role": "system",
-            "content": """You are a helpful customer support agent.
-
-You have tools to:
-- Check the current customer sentiment (use this to adapt your tone)
-- Check if escalation is needed
-- End the call
-- Transfer to a supervisor
-
-IMPORTANT: Be extra empathetic if sentiment is negative or frustrated.
-If the customer seems very upset, proactively offer to transfer to a supervisor.
+        # Schemas only describe the methods, so build them once and share them
+        if SupportAgent._tool_schemas is None:
+            SupportAgent._tool_schemas = self.tool_registry.get_schemas()
+        self.tool_schemas = SupportAgent._tool_schemas
 
-Keep responses concise and helpful.""",
-        })
+        self.context.add_message({"role": "system", "content": SYSTEM_PROMPT})
 
     async def generate_response(self):
         """Generate response with sentiment awareness."""
@@ -105,18 +116,37 @@ Keep responses concise and helpful.""",
                             "type": "function",
                             "function": {
                                 "name": tc.name,
-                                "arguments": str(tc.arguments),
+                                "arguments": (
+                                    json.dumps(tc.arguments) if isinstance(tc.arguments, dict)
+                                    else str(tc.arguments)
+                                ),
                             },
                         }
                         for tc in tool_calls
                     ],
                 },
-                *[
+                *(
                     {"role": "tool", "tool_call_id": tc.id, "content": "" if result.content is None else str(result.content)}
                     for tc, result in zip(tool_calls, results)
-                ],
+                ),
             ])
 
+            # These tools already settle the turn, skip the follow-up LLM call.
+            # Results are JSON encoded by the registry, and end_call returns
+            # nothing, so only the transfer sentence is spoken
+            if all(tc.name in FINAL_TOOLS for tc in tool_calls) and not any(
+                r.is_error for r in results
+            ):
+                reply = " ".join(
+                    json.loads(r.content)
+                    for tc, r in zip(tool_calls, results)
+                    if tc.name == "transfer_to_supervisor"
+                )
+                if reply:
+                    self.context.add_message({"role": "assistant", "content": reply})
+                    yield reply
+                return
+
             final_response = await self.llm.chat(
                 messages=self.context.messages, stream=True
             )
@@ -0,0 +1,31 @@
+"""Tests for the keyword fast path in front of the sentiment LLM."""
+
+import pytest
+
+from sentiment_analyzer import _keyword_sentiment
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "I am not upset, just asking",
+        "No, I do not hate it",
+        "That was not stupid at all, thanks",
+        "I hate to bother you, thanks so much",
+    ],
+)
+def test_negated_or_mixed_wording_goes_to_the_llm(text):
+    assert _keyword_sentiment(text) is None
+
+
+@pytest.mark.parametrize(
+    "text, sentiment",
+    [
+        ("This is ridiculous, I've been waiting an hour", "frustrated"),
+        ("I'm really disappointed with the service", "negative"),
+        ("Thanks, that's perfect", "positive"),
+        ("What are your opening hours", None),
+    ],
+)
+def test_unambiguous_wording_is_classified_locally(text, sentiment):
+    assert _keyword_sentiment(text) == sentiment
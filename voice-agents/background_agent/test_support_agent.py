@@ -0,0 +1,76 @@
+"""Tests for the replies SupportAgent speaks after call-control tools."""
+
+import asyncio
+
+import pytest
+from smallestai.atoms.agent.clients.types import ChatChunk, ToolCall
+
+from support_agent import SupportAgent
+
+
+class FakeSentimentAnalyzer:
+    def should_escalate(self):
+        return False
+
+    def get_sentiment_summary(self):
+        return {"current": "neutral", "overall": "neutral", "frustration_count": 0}
+
+
+class FakeLLM:
+    """Returns one tool call, and fails if a follow-up completion is requested."""
+
+    def __init__(self, tool_name):
+        self.tool_name = tool_name
+        self.calls = 0
+
+    async def chat(self, messages, stream, tools=None):
+        self.calls += 1
+        assert self.calls == 1, "unexpected follow-up LLM call"
+        return self._stream()
+
+    async def _stream(self):
+        yield ChatChunk(
+            content=None,
+            tool_calls=[ToolCall(id="call_1", name=self.tool_name, arguments="{}")],
+        )
+
+
+@pytest.fixture(autouse=True)
+def openai_key(monkeypatch):
+    # The client is never used, it only needs a key to be constructed
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+
+
+def run_turn(tool_name):
+    agent = SupportAgent(FakeSentimentAnalyzer())
+    agent.llm = FakeLLM(tool_name)
+    sent = []
+
+    async def send_event(event):
+        sent.append(event)
+
+    agent.send_event = send_event
+
+    async def collect():
+        return [text async for text in agent.generate_response()]
+
+    return agent, asyncio.run(collect()), sent
+
+
+def test_end_call_says_nothing():
+    agent, spoken, sent = run_turn("end_call")
+
+    assert spoken == []
+    assert len(sent) == 1
+    assert agent.context.messages[-1]["role"] == "tool"
+
+
+def test_transfer_speaks_the_plain_sentence():
+    agent, spoken, _ = run_turn("transfer_to_supervisor")
+
+    sentence = (
+        "I've noted your request to speak with a supervisor. "
+        "In a production setup, you would now be transferred."
+    )
+    assert spoken == [sentence]
+    assert agent.context.messages[-1] == {"role": "assistant", "content": sentence}
@@ -14,6 +14,15 @@ from smallestai.atoms import Campaign, AtomsClient
 load_dotenv()
 
 
+def append_env(path, key, value):
+    """Append KEY=value to a .env file in one write, so concurrent runs don't interleave."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+    try:
+        os.write(fd, f"{key}={value}\n".encode())
+    finally:
+        os.close(fd)
+
+
 def main():
     """Create an outbound campaign."""
     
@@ -61,9 +70,7 @@ def main():
     print(f"✓ Campaign created: {campaign_id}")
     
     # Save for later use
-    env_path = os.path.join(os.path.dirname(__file__), ".env")
-    with open(env_path, "a") as f:
-        f.write(f"CAMPAIGN_ID={campaign_id}\n")
+    append_env(os.path.join(os.path.dirname(__file__), ".env"), "CAMPAIGN_ID", campaign_id)
     
     print(f"✓ CAMPAIGN_ID saved to .env")
     print(f"\nNext: Run start_campaign.py to start dialing")
@@ -8,15 +8,28 @@ Usage:
     python manage_campaign.py stop
     python manage_campaign.py pause
     python manage_campaign.py status
+    python manage_campaign.py list
+    python manage_campaign.py list --metrics
 """
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from dotenv import load_dotenv
 from smallestai.atoms import Campaign
 
 load_dotenv()
 
+# Max campaign detail requests in flight at once for `list --metrics`
+MAX_CONCURRENT_FETCHES = 16
+
+
+@lru_cache(maxsize=1)
+def get_campaign_client():
+    """Get the shared Campaign client, created on first use."""
+    return Campaign()
+
 
 def get_campaign_id():
     """Get campaign ID from environment."""
@@ -29,7 +42,7 @@ def get_campaign_id():
 
 def start_campaign():
     """Start the campaign."""
-    campaign = Campaign()
+    campaign = get_campaign_client()
     campaign_id = get_campaign_id()
     
     print(f"Starting campaign: {campaign_id}")
@@ -40,7 +53,7 @@ def start_campaign():
 
 def stop_campaign():
     """Stop the campaign."""
-    campaign = Campaign()
+    campaign = get_campaign_client()
     campaign_id = get_campaign_id()
     
     print(f"Stopping campaign: {campaign_id}")
@@ -50,7 +63,7 @@ def stop_campaign():
 
 def pause_campaign():
     """Pause the campaign."""
-    campaign = Campaign()
+    campaign = get_campaign_client()
     campaign_id = get_campaign_id()
     
     print(f"Pausing campaign: {campaign_id}")
@@ -60,7 +73,7 @@ def pause_campaign():
 
 def get_status():
     """Get campaign status."""
-    campaign = Campaign()
+    campaign = get_campaign_client()
     campaign_id = get_campaign_id()
     
     print(f"Getting status for: {campaign_id}")
@@ -81,9 +94,9 @@ def get_status():
         print(f"  Contacts connected: {metrics.get('contacts_connected', 0)}")
 
 
-def list_campaigns():
-    """List all campaigns."""
-    campaign = Campaign()
+def list_campaigns(show_metrics=False):
+    """List all campaigns, optionally with each campaign's call metrics."""
+    campaign = get_campaign_client()
     
     print("Listing all campaigns...")
     result = campaign.list()
@@ -95,11 +108,21 @@ def list_campaigns():
     
     total = result.get("data", {}).get("totalCampaignCount", len(campaigns))
     print(f"\nFound {len(campaigns)} of {total} campaign(s):\n")
-    for c in campaigns:
-        print(f"  ID: {c.get('_id', 'N/A')}")
-        print(f"  Name: {c.get('name', 'N/A')}")
-        print(f"  Status: {c.get('status', 'N/A')}")
-        print()
+    
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as pool:
+        # Fetch every campaign's details at once, printing each in list order as it's ready.
+        # Campaigns without an ID can't be looked up, so they're listed without metrics.
+        ids = [c.get("_id") for c in campaigns]
+        details = pool.map(campaign.get, filter(None, ids)) if show_metrics else None
+        for c, campaign_id in zip(campaigns, ids):
+            print(f"  ID: {c.get('_id', 'N/A')}")
+            print(f"  Name: {c.get('name', 'N/A')}")
+            print(f"  Status: {c.get('status', 'N/A')}")
+            if details is not None and campaign_id:
+                metrics = next(details).get("data", {}).get("metrics", {})
+                print(f"  Called: {metrics.get('contacts_called', 0)}/{metrics.get('total_participants', 0)}, "
+                      f"connected: {metrics.get('contacts_connected', 0)}")
+            print()
 
 
 def main():
@@ -111,7 +134,7 @@ def main():
         print("  stop    - Stop the campaign")
         print("  pause   - Pause the campaign")
         print("  status  - Get campaign status")
-        print("  list    - List all campaigns")
+        print("  list    - List all campaigns (add --metrics for call progress)")
         sys.exit(1)
     
     command = sys.argv[1].lower()
@@ -125,7 +148,7 @@ def main():
     elif command == "status":
         get_status()
     elif command == "list":
-        list_campaigns()
+        list_campaigns(show_metrics="--metrics" in sys.argv[2:])
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
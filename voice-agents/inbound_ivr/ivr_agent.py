@@ -1,7 +1,9 @@
 """IVR Agent with intent routing and department transfers."""
 
+import json
 import os
-from typing import List
+import time
+from typing import List, Optional
 
 from dotenv import load_dotenv
 from loguru import logger
@@ -24,6 +26,42 @@ from smallestai.atoms.agent.tools import ToolRegistry, function_tool
 load_dotenv()
 
 
+# Streamed text is flushed at a sentence end, a size limit or a time limit
+FLUSH_CHARS = 64
+FLUSH_SECONDS = 0.02
+SENTENCE_ENDS = (".", "!", "?", "\n")
+
+
+async def coalesce_chunks(response, tool_calls: Optional[List[ToolCall]] = None):
+    """Yield streamed text in short batches, collecting any tool calls."""
+    parts: List[str] = []
+    size = 0
+    flush_at = 0.0
+
+    async for chunk in response:
+        if chunk.tool_calls and tool_calls is not None:
+            tool_calls.extend(chunk.tool_calls)
+
+        text = chunk.content or ""
+        if text:
+            if not parts:
+                flush_at = time.monotonic() + FLUSH_SECONDS
+            parts.append(text)
+            size += len(text)
+
+        if parts and (
+            size >= FLUSH_CHARS
+            or text.rstrip(" ").endswith(SENTENCE_ENDS)
+            or time.monotonic() >= flush_at
+        ):
+            yield "".join(parts)
+            parts = []
+            size = 0
+
+    if parts:
+        yield "".join(parts)
+
+
 # Department configuration
 DEPARTMENTS = {
     "sales": {
@@ -48,6 +86,41 @@ DEPARTMENTS = {
     }
 }
 
+# Department text is fixed, so build it once for the prompt and get_departments
+DEPARTMENT_LIST = "\n".join(
+    f"- {name}: {info['description']}" for name, info in DEPARTMENTS.items()
+)
+DEPARTMENT_DETAILS = "\n".join(
+    f"{name.title()}: {info['description']} (Hours: {info['hours']})"
+    for name, info in DEPARTMENTS.items()
+)
+UNKNOWN_DEPARTMENT = "Unknown department: {}. Available: " + ", ".join(DEPARTMENTS)
+
+SYSTEM_PROMPT = f"""\
+You are a professional IVR (Interactive Voice Response) agent for TechCorp.
+
+Your job is to:
+1. Greet callers warmly
+2. Understand what they need help with
+3. Route them to the correct department
+
+AVAILABLE DEPARTMENTS:
+{DEPARTMENT_LIST}
+
+ROUTING RULES:
+- Ask clarifying questions if the intent is unclear
+- Confirm the department before transferring
+- Offer alternatives if the requested department is closed
+- Use warm transfer for complex issues, cold transfer for simple routing
+
+IMPORTANT:
+- Be concise - IVR interactions should be quick
+- Confirm before transferring: "I'll connect you to [department]. Is that correct?"
+- If user says "operator" or "representative", transfer to support
+
+Always use the appropriate tool to transfer or end the call.\
+"""
+
 
 class IVRAgent(OutputAgentNode):
     """IVR-style agent that routes callers to the right department.
@@ -59,14 +132,20 @@ class IVRAgent(OutputAgentNode):
     - Multi-department configuration
     """
 
+    _llm = None
+    _tool_schemas = None
+
     def __init__(self):
         super().__init__(name="ivr-agent")
         
-        self.llm = OpenAIClient(
-            model="gpt-4o-mini",
-            temperature=0.3,  # Lower temperature for consistent routing
-            api_key=os.getenv("OPENAI_API_KEY")
-        )
+        # One client per process, so every session reuses its connection pool
+        if IVRAgent._llm is None:
+            IVRAgent._llm = OpenAIClient(
+                model="gpt-4o-mini",
+                temperature=0.3,  # Lower temperature for consistent routing
+                api_key=os.getenv("OPENAI_API_KEY")
+            )
+        self.llm = IVRAgent._llm
 
         # Track call state
         self.detected_intent: str = None
@@ -75,39 +154,11 @@ class IVRAgent(OutputAgentNode):
         # Initialize tools
         self.tool_registry = ToolRegistry()
         self.tool_registry.discover(self)
-        self.tool_schemas = self.tool_registry.get_schemas()
-
-        # Build department list for prompt
-        dept_list = "\n".join([
-            f"- {name}: {info['description']}"
-            for name, info in DEPARTMENTS.items()
-        ])
+        if IVRAgent._tool_schemas is None:
+            IVRAgent._tool_schemas = self.tool_registry.get_schemas()
+        self.tool_schemas = IVRAgent._tool_schemas
 
-        self.context.add_message({
-            "role": "system",
-            "content": f"""You are a professional IVR (Interactive Voice Response) agent for TechCorp.
-
-Your job is to:
-1. Greet callers warmly
-2. Understand what they need help with
-3. Route them to the correct department
-
-AVAILABLE DEPARTMENTS:
-{dept_list}
-
-ROUTING RULES:
-- Ask clarifying questions if the intent is unclear
-- Confirm the department before transferring
-- Offer alternatives if the requested department is closed
-- Use warm transfer for complex issues, cold transfer for simple routing
-
-IMPORTANT:
-- Be concise - IVR interactions should be quick
-- Confirm before transferring: "I'll connect you to [department]. Is that correct?"
-- If user says "operator" or "representative", transfer to support
-
-Always use the appropriate tool to transfer or end the call.""",
-        })
+        self.context.add_message({"role": "system", "content": SYSTEM_PROMPT})
 
     async def generate_response(self):
         """Generate response with intent routing."""
@@ -119,15 +170,13 @@ Always use the appropriate tool to transfer or end the call.""",
         )
 
         tool_calls: List[ToolCall] = []
-        full_response = ""
+        response_parts: List[str] = []
 
-        async for chunk in response:
-            if chunk.content:
-                full_response += chunk.content
-                yield chunk.content
-            if chunk.tool_calls:
-                tool_calls.extend(chunk.tool_calls)
+        async for text in coalesce_chunks(response, tool_calls):
+            response_parts.append(text)
+            yield text
 
+        full_response = "".join(response_parts)
         if full_response and not tool_calls:
             self.context.add_message({"role": "assistant", "content": full_response})
 
@@ -136,39 +185,34 @@ Always use the appropriate tool to transfer or end the call.""",
                 tool_calls=tool_calls, parallel=True
             )
 
-            self.context.add_messages([
-                {
-                    "role": "assistant",
-                    "content": "",
-                    "tool_calls": [
-                        {
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.name,
-                                "arguments": str(tc.arguments),
-                            },
-                        }
-                        for tc in tool_calls
-                    ],
-                },
-                *[
-                    {
-                        "role": "tool",
-                        "tool_call_id": tc.id,
-                        "content": "" if result.content is None else str(result.content),
-                    }
-                    for tc, result in zip(tool_calls, results)
-                ],
-            ])
+            # Build the assistant tool_calls entry and the tool results in one pass
+            call_entries = []
+            messages = [{"role": "assistant", "content": "", "tool_calls": call_entries}]
+            for tc, result in zip(tool_calls, results):
+                call_entries.append({
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.name,
+                        "arguments": (
+                            json.dumps(tc.arguments) if isinstance(tc.arguments, dict)
+                            else str(tc.arguments)
+                        ),
+                    },
+                })
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": tc.id,
+                    "content": "" if result.content is None else str(result.content),
+                })
+            self.context.add_messages(messages)
 
             final_response = await self.llm.chat(
                 messages=self.context.messages, stream=True
             )
 
-            async for chunk in final_response:
-                if chunk.content:
-                    yield chunk.content
+            async for text in coalesce_chunks(final_response):
+                yield text
 
     # =========================================
     # DEPARTMENT TOOLS
@@ -180,12 +224,7 @@ Always use the appropriate tool to transfer or end the call.""",
         
         Use this to help the caller understand their options.
         """
-        dept_info = []
-        for name, info in DEPARTMENTS.items():
-            dept_info.append(
-                f"{name.title()}: {info['description']} (Hours: {info['hours']})"
-            )
-        return "\n".join(dept_info)
+        return DEPARTMENT_DETAILS
 
     @function_tool()
     async def transfer_to_department(
@@ -204,7 +243,7 @@ Always use the appropriate tool to transfer or end the call.""",
         dept = department.lower()
         
         if dept not in DEPARTMENTS:
-            return f"Unknown department: {department}. Available: {', '.join(DEPARTMENTS.keys())}"
+            return UNKNOWN_DEPARTMENT.format(department)
         
         dept_info = DEPARTMENTS[dept]
         self.detected_intent = dept
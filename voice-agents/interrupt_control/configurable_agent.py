@@ -1,7 +1,9 @@
 """Agent with runtime-configurable settings."""
 
+import json
 import os
-from typing import List
+import time
+from typing import List, Optional
 
 from dotenv import load_dotenv
 from loguru import logger
@@ -19,6 +21,42 @@ from smallestai.atoms.agent.tools import ToolRegistry, function_tool
 load_dotenv()
 
 
+# Streamed text is flushed at a sentence end, a size limit or a time limit
+FLUSH_CHARS = 64
+FLUSH_SECONDS = 0.02
+SENTENCE_ENDS = (".", "!", "?", "\n")
+
+
+async def coalesce_chunks(response, tool_calls: Optional[List[ToolCall]] = None):
+    """Yield streamed text in short batches, collecting any tool calls."""
+    parts: List[str] = []
+    size = 0
+    flush_at = 0.0
+
+    async for chunk in response:
+        if chunk.tool_calls and tool_calls is not None:
+            tool_calls.extend(chunk.tool_calls)
+
+        text = chunk.content or ""
+        if text:
+            if not parts:
+                flush_at = time.monotonic() + FLUSH_SECONDS
+            parts.append(text)
+            size += len(text)
+
+        if parts and (
+            size >= FLUSH_CHARS
+            or text.rstrip(" ").endswith(SENTENCE_ENDS)
+            or time.monotonic() >= flush_at
+        ):
+            yield "".join(parts)
+            parts = []
+            size = 0
+
+    if parts:
+        yield "".join(parts)
+
+
 class ConfigurableAgent(OutputAgentNode):
     """Agent that can dynamically mute/unmute user to control interrupts.
     
@@ -28,14 +66,19 @@ class ConfigurableAgent(OutputAgentNode):
     - Auto-unmutes after each response completes
     """
 
+    _llm = None
+    _tool_schemas = None
+
     def __init__(self):
         super().__init__(name="configurable-agent")
         
-        self.llm = OpenAIClient(
-            model="gpt-4o-mini",
-            temperature=0.7,
-            api_key=os.getenv("OPENAI_API_KEY")
-        )
+        if ConfigurableAgent._llm is None:
+            ConfigurableAgent._llm = OpenAIClient(
+                model="gpt-4o-mini",
+                temperature=0.7,
+                api_key=os.getenv("OPENAI_API_KEY")
+            )
+        self.llm = ConfigurableAgent._llm
 
         # Track if user is muted (for auto-unmute)
         self.user_muted = False
@@ -43,7 +86,9 @@ class ConfigurableAgent(OutputAgentNode):
         # Initialize tools
         self.tool_registry = ToolRegistry()
         self.tool_registry.discover(self)
-        self.tool_schemas = self.tool_registry.get_schemas()
+        if ConfigurableAgent._tool_schemas is None:
+            ConfigurableAgent._tool_schemas = self.tool_registry.get_schemas()
+        self.tool_schemas = ConfigurableAgent._tool_schemas
 
         self.context.add_message({
             "role": "system",
@@ -75,15 +120,13 @@ Example: "say 7 words without interruption"
         )
 
         tool_calls: List[ToolCall] = []
-        full_response = ""
+        response_parts: List[str] = []
 
-        async for chunk in response:
-            if chunk.content:
-                full_response += chunk.content
-                yield chunk.content
-            if chunk.tool_calls:
-                tool_calls.extend(chunk.tool_calls)
+        async for text in coalesce_chunks(response, tool_calls):
+            response_parts.append(text)
+            yield text
 
+        full_response = "".join(response_parts)
         if full_response and not tool_calls:
             self.context.add_message({"role": "assistant", "content": full_response})
 
@@ -92,35 +135,34 @@ Example: "say 7 words without interruption"
                 tool_calls=tool_calls, parallel=True
             )
 
-            self.context.add_messages([
-                {
-                    "role": "assistant",
-                    "content": "",
-                    "tool_calls": [
-                        {
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.name,
-                                "arguments": str(tc.arguments),
-                            },
-                        }
-                        for tc in tool_calls
-                    ],
-                },
-                *[
-                    {"role": "tool", "tool_call_id": tc.id, "content": "" if result.content is None else str(result.content)}
-                    for tc, result in zip(tool_calls, results)
-                ],
-            ])
+            # Build the assistant tool_calls entry and the tool results in one pass
+            call_entries = []
+            messages = [{"role": "assistant", "content": "", "tool_calls": call_entries}]
+            for tc, result in zip(tool_calls, results):
+                call_entries.append({
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.name,
+                        "arguments": (
+                            json.dumps(tc.arguments) if isinstance(tc.arguments, dict)
+                            else str(tc.arguments)
+                        ),
+                    },
+                })
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": tc.id,
+                    "content": "" if result.content is None else str(result.content),
+                })
+            self.context.add_messages(messages)
 
             final_response = await self.llm.chat(
                 messages=self.context.messages, stream=True
             )
 
-            async for chunk in final_response:
-                if chunk.content:
-                    yield chunk.content
+            async for text in coalesce_chunks(final_response):
+                yield text
         
         # Auto-unmute after response finishes
         if self.user_muted:
@@ -7,21 +7,27 @@ Two ways to add content to a Knowledge Base:
 
 Usage:
     python setup_kb.py
+
+Both examples run at the same time, each creating its own Knowledge Base.
 """
 
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from smallestai.atoms import KB
 
 load_dotenv()
 
+TMPFS_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
 
-def example_pdf_upload():
+def example_pdf_upload(log=print):
     """Upload a PDF file to Knowledge Base."""
     
-    print("=" * 50)
-    print("PDF UPLOAD EXAMPLE")
-    print("=" * 50)
+    log("=" * 50)
+    log("PDF UPLOAD EXAMPLE")
+    log("=" * 50)
     
     kb = KB()
     
@@ -31,56 +37,59 @@ def example_pdf_upload():
         description="Coffee drinks, food, and prices"
     )
     kb_id = result["data"]["_id"]
-    print(f"Created KB: {kb_id}")
+    log(f"Created KB: {kb_id}")
     
     # Create sample PDF
     try:
         from reportlab.lib.pagesizes import letter
         from reportlab.pdfgen import canvas
         
-        pdf_path = "/tmp/menu.pdf"
-        c = canvas.Canvas(pdf_path, pagesize=letter)
+        # add_file takes a path, so write the PDF to a throwaway directory
+        # (on tmpfs when available, so it never touches disk)
+        with tempfile.TemporaryDirectory(dir=TMPFS_DIR) as tmp_dir:
+            pdf_path = os.path.join(tmp_dir, "menu.pdf")
+            c = canvas.Canvas(pdf_path, pagesize=letter)
         
-        c.setFont("Helvetica-Bold", 24)
-        c.drawString(200, 750, "STARBUCKS MENU")
+            c.setFont("Helvetica-Bold", 24)
+            c.drawString(200, 750, "STARBUCKS MENU")
         
-        c.setFont("Helvetica", 12)
-        items = [
-            "Caffe Latte: $5.25",
-            "Cappuccino: $4.95", 
-            "Frappuccino: $6.25",
-            "Cold Brew: $4.75",
-            "Croissant: $3.75",
-            "Banana Bread: $3.95",
-        ]
-        y = 700
-        for item in items:
-            c.drawString(60, y, item)
-            y -= 25
+            c.setFont("Helvetica", 12)
+            items = [
+                "Caffe Latte: $5.25",
+                "Cappuccino: $4.95", 
+                "Frappuccino: $6.25",
+                "Cold Brew: $4.75",
+                "Croissant: $3.75",
+                "Banana Bread: $3.95",
+            ]
+            y = 700
+            for item in items:
+                c.drawString(60, y, item)
+                y -= 25
         
-        c.save()
+            c.save()
         
-        # Upload PDF
-        kb.add_file(kb_id, pdf_path)
-        print(f"Uploaded: {pdf_path}")
+            # Upload PDF
+            kb.add_file(kb_id, pdf_path)
+            log(f"Uploaded: {os.path.basename(pdf_path)}")
         
     except ImportError:
-        print("Install reportlab for PDF creation: pip install reportlab")
+        log("Install reportlab for PDF creation: pip install reportlab")
     
     # Check status
     items = kb.get_items(kb_id)
     for item in items.get("data", []):
-        print(f"  {item['fileName']}: {item['processingStatus']}")
+        log(f"  {item['fileName']}: {item['processingStatus']}")
     
     return kb_id
 
 
-def example_url_scrape():
+def example_url_scrape(log=print):
     """Scrape a URL into Knowledge Base."""
     
-    print("\n" + "=" * 50)
-    print("URL SCRAPING EXAMPLE")
-    print("=" * 50)
+    log("\n" + "=" * 50)
+    log("URL SCRAPING EXAMPLE")
+    log("=" * 50)
     
     kb = KB()
     
@@ -90,20 +99,20 @@ def example_url_scrape():
         description="Python programming documentation"
     )
     kb_id = result["data"]["_id"]
-    print(f"Created KB: {kb_id}")
+    log(f"Created KB: {kb_id}")
     
     # Scrape URL
     url = "https://en.wikipedia.org/wiki/Python_(programming_language)"
-    print(f"Scraping: {url}")
+    log(f"Scraping: {url}")
     
     kb.scrape_urls(kb_id, [url])
-    print("Scrape initiated")
+    log("Scrape initiated")
     
     # Check scraped URLs
     scraped = kb.get_scraped_urls(kb_id)
     for host in scraped.get("data", []):
         for u in host.get("scrapedUrls", []):
-            print(f"  {u['url']}: {u['processingStatus']}")
+            log(f"  {u['url']}: {u['processingStatus']}")
     
     return kb_id
 
@@ -111,8 +120,17 @@ def example_url_scrape():
 if __name__ == "__main__":
     print("\nKnowledge Base Examples\n")
     
-    pdf_kb = example_pdf_upload()
-    url_kb = example_url_scrape()
+    # The two examples are independent, so run them at the same time. Each logs
+    # into its own list, so their output isn't interleaved.
+    pdf_log, url_log = [], []
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        pdf_future = pool.submit(example_pdf_upload, pdf_log.append)
+        url_future = pool.submit(example_url_scrape, url_log.append)
+        try:
+            pdf_kb = pdf_future.result()
+            url_kb = url_future.result()
+        finally:
+            print("\n".join(pdf_log + url_log))
     
     print("\n" + "=" * 50)
     print("DONE")
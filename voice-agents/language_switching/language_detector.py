@@ -1,6 +1,12 @@
 """Language detection node that processes user input before the main agent."""
 
+import asyncio
 import os
+import re
+from collections import Counter, OrderedDict
+from typing import Optional, Tuple
+
+import orjson
 from dotenv import load_dotenv
 from loguru import logger
 
@@ -13,6 +19,48 @@ from smallestai.atoms.agent.nodes.base import Node
 
 load_dotenv()
 
+DETECT_PROMPT = """\
+Detect the language of the text.
+Respond with JSON: {"language": "english", "confidence": 0.95}
+Common languages: english, spanish, french, german, portuguese, chinese, japanese, korean, hindi, arabic
+Only respond with the JSON, nothing else.\
+"""
+
+# Shorter messages ("ok", "?") don't say much about the language
+MIN_DETECT_CHARS = 3
+
+# Scripts used by only one language, so a message written mostly in them
+# needs no LLM call. Han, Arabic and Devanagari are left to the LLM, since
+# they are shared by Chinese/Japanese, Arabic/Urdu/Persian and
+# Hindi/Marathi/Nepali. Japanese mixes kana with Han, so Han counts towards
+# Japanese once the message contains kana.
+KANA_RE = re.compile(r"[\u3040-\u30ff]")
+HAN_RE = re.compile(r"[\u4e00-\u9fff]")
+HANGUL_RE = re.compile(r"[\uac00-\ud7af\u1100-\u11ff]")
+# Share of the letters that must be in the script, so a name or symbol in
+# another script doesn't switch the language of an English message
+MIN_SCRIPT_SHARE = 0.5
+SCRIPT_CONFIDENCE = 0.95
+
+# Short replies like "yes" or "hola" repeat a lot, cache their detection
+MAX_CACHED_DETECTIONS = 1024
+
+
+def _script_language(text: str) -> Optional[str]:
+    """Return the language for text mostly in a language-specific script, else None."""
+    letters = sum(c.isalpha() for c in text)
+    if not letters:
+        return None
+
+    if len(HANGUL_RE.findall(text)) > letters * MIN_SCRIPT_SHARE:
+        return "korean"
+
+    kana = len(KANA_RE.findall(text))
+    if kana and kana + len(HAN_RE.findall(text)) > letters * MIN_SCRIPT_SHARE:
+        return "japanese"
+
+    return None
+
 
 class LanguageDetector(Node):
     """Detects language and enriches events for downstream nodes.
@@ -29,16 +77,23 @@ class LanguageDetector(Node):
     - Analytics
     """
 
+    _llm = None
+
     def __init__(self):
         super().__init__(name="language-detector")
-        self.llm = OpenAIClient(
-            model="gpt-4o-mini",
-            api_key=os.getenv("OPENAI_API_KEY")
-        )
+        if LanguageDetector._llm is None:
+            LanguageDetector._llm = OpenAIClient(
+                model="gpt-4o-mini",
+                api_key=os.getenv("OPENAI_API_KEY")
+            )
+        self.llm = LanguageDetector._llm
         
         self.detected_language: str = "english"
         self.language_confidence: float = 1.0
-        self.language_history: list = []
+        self.language_counts: Counter = Counter()
+
+        # Detection for recently seen text, least recently used first
+        self._detections: "OrderedDict[str, asyncio.Future]" = OrderedDict()
 
     async def process_event(self, event: SDKEvent):
         """Process event and pass it downstream."""
@@ -52,43 +107,71 @@ class LanguageDetector(Node):
 
     async def _detect_language(self, text: str):
         """Detect language of the text."""
+        language = _script_language(text)
+        if not language and len(text.strip()) < MIN_DETECT_CHARS:
+            # Too short to tell, keep the current language
+            return
+
         try:
-            response = await self.llm.chat(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """Detect the language of the text.
-Respond with JSON: {"language": "english", "confidence": 0.95}
-Common languages: english, spanish, french, german, portuguese, chinese, japanese, korean, hindi, arabic
-Only respond with the JSON, nothing else."""
-                    },
-                    {"role": "user", "content": text}
-                ],
-                stream=False
-            )
-            
-            import json
-            result = json.loads(response.content)
-            
-            self.detected_language = result.get("language", "english").lower()
-            self.language_confidence = result.get("confidence", 0.5)
-            self.language_history.append(self.detected_language)
-            
-            logger.info(
-                f"[LanguageDetector] Detected: {self.detected_language} "
-                f"(confidence: {self.language_confidence:.0%})"
-            )
-            
+            if language:
+                confidence = SCRIPT_CONFIDENCE
+            else:
+                language, confidence = await self._cached_detect_language(text)
         except Exception as e:
             logger.error(f"[LanguageDetector] Detection failed: {e}")
             self.detected_language = "english"
             self.language_confidence = 0.5
+            return
+
+        self.detected_language = language
+        self.language_confidence = confidence
+        self.language_counts[language] += 1
+
+        logger.info(
+            f"[LanguageDetector] Detected: {self.detected_language} "
+            f"(confidence: {self.language_confidence:.0%})"
+        )
+
+    async def _cached_detect_language(self, text: str) -> Tuple[str, float]:
+        """Detect via the LLM, reusing results (or an in-flight request) for repeated text."""
+        key = " ".join(text.lower().split())[:64]
+        detection = self._detections.get(key)
+        if detection is None:
+            detection = asyncio.ensure_future(self._llm_detect_language(text))
+            self._detections[key] = detection
+            if len(self._detections) > MAX_CACHED_DETECTIONS:
+                self._detections.popitem(last=False)
+        else:
+            self._detections.move_to_end(key)
+
+        try:
+            # Shield so a cancelled caller doesn't cancel the shared request
+            return await asyncio.shield(detection)
+        except Exception:
+            # Don't cache failures, the next message retries
+            if self._detections.get(key) is detection:
+                del self._detections[key]
+            raise
+
+    async def _llm_detect_language(self, text: str) -> Tuple[str, float]:
+        """Ask the LLM for the language, for text the script check can't decide."""
+        response = await self.llm.chat(
+            messages=[
+                {"role": "system", "content": DETECT_PROMPT},
+                {"role": "user", "content": text}
+            ],
+            stream=False,
+            # JSON mode guarantees a parseable object, and the reply is tiny
+            response_format={"type": "json_object"},
+            max_tokens=32,
+        )
+
+        result = orjson.loads(response.content)
+        return result.get("language", "english").lower(), result.get("confidence", 0.5)
 
     def get_primary_language(self) -> str:
         """Get the most commonly detected language in this session."""
-        if not self.language_history:
+        if not self.language_counts:
             return "english"
         
-        from collections import Counter
-        counts = Counter(self.language_history)
-        return counts.most_common(1)[0][0]
+        return self.language_counts.most_common(1)[0][0]
@@ -15,6 +15,25 @@ PROFANITY_WORDS = {
     "damn", "hell", "crap"  # Add more as needed
 }
 
+# All words in one case-insensitive pattern, so each chunk is scanned once.
+# Whole words only, so "hello" and "shell" pass through untouched.
+PROFANITY_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, sorted(PROFANITY_WORDS, key=len, reverse=True))) + r")\b",
+    re.IGNORECASE,
+)
+
+# Cheap early reject: a chunk can only match if it is long enough and
+# contains the first letter of some word
+MIN_WORD_LENGTH = min(map(len, PROFANITY_WORDS))
+PROFANITY_FIRST_CHARS = frozenset(
+    c for word in PROFANITY_WORDS for c in (word[0].lower(), word[0].upper())
+)
+
+
+def _mask(match: re.Match) -> str:
+    """Asterisks the length of the matched word."""
+    return "*" * len(match.group())
+
 
 class ProfanityFilter(Node):
     """Filters profanity from agent responses before they reach TTS.
@@ -41,22 +60,18 @@ class ProfanityFilter(Node):
             if filtered_text != event.text:
                 self.filtered_count += 1
                 logger.warning(f"[ProfanityFilter] Filtered content")
+                # Copy rather than edit, the event may be shared with other nodes
+                event = event.model_copy(update={"text": filtered_text})
             
-            # Create new event with filtered text
-            filtered_event = SDKAgentLLMResponseChunkEvent(text=filtered_text)
-            await self.send_event(filtered_event)
+            # Clean chunks go downstream as-is, no new event needed
+            await self.send_event(event)
         else:
             # Pass through unchanged
             await self.send_event(event)
 
     def _filter_text(self, text: str) -> str:
         """Replace profanity with asterisks."""
-        result = text
-        
-        for word in PROFANITY_WORDS:
-            # Case-insensitive replacement
-            pattern = re.compile(re.escape(word), re.IGNORECASE)
-            replacement = "*" * len(word)
-            result = pattern.sub(replacement, result)
-        
-        return result
+        # Most chunks are a token or two, skip the regex when nothing can match
+        if len(text) < MIN_WORD_LENGTH or PROFANITY_FIRST_CHARS.isdisjoint(text):
+            return text
+        return PROFANITY_RE.sub(_mask, text)
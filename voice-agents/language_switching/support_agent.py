@@ -1,7 +1,9 @@
 """Support agent that works in a processing pipeline."""
 
+import json
 import os
-from typing import TYPE_CHECKING, List
+import time
+from typing import TYPE_CHECKING, List, Optional
 
 from dotenv import load_dotenv
 
@@ -16,6 +18,51 @@ if TYPE_CHECKING:
 
 load_dotenv()
 
+# Streamed text is flushed at a sentence end, a size limit or a time limit
+FLUSH_CHARS = 64
+FLUSH_SECONDS = 0.02
+SENTENCE_ENDS = (".", "!", "?", "\n")
+
+SYSTEM_PROMPT = """\
+You are a helpful multilingual support agent.
+
+You can detect and respond in multiple languages:
+- Use the get_user_language tool to check what language the user is speaking
+- Respond in the same language as the user when appropriate
+- Default to English if unsure
+
+Be helpful, concise, and friendly."""
+
+
+async def coalesce_chunks(response, tool_calls: Optional[List[ToolCall]] = None):
+    """Yield streamed text in short batches, collecting any tool calls."""
+    parts: List[str] = []
+    size = 0
+    flush_at = 0.0
+
+    async for chunk in response:
+        if chunk.tool_calls and tool_calls is not None:
+            tool_calls.extend(chunk.tool_calls)
+
+        text = chunk.content or ""
+        if text:
+            if not parts:
+                flush_at = time.monotonic() + FLUSH_SECONDS
+            parts.append(text)
+            size += len(text)
+
+        if parts and (
+            size >= FLUSH_CHARS
+            or text.rstrip(" ").endswith(SENTENCE_ENDS)
+            or time.monotonic() >= flush_at
+        ):
+            yield "".join(parts)
+            parts = []
+            size = 0
+
+    if parts:
+        yield "".join(parts)
+
 
 class SupportAgent(OutputAgentNode):
     """Support agent that adapts based on pipeline node data.
@@ -26,33 +73,31 @@ class SupportAgent(OutputAgentNode):
     - Sends responses through ProfanityFilter before TTS
     """
 
+    _llm = None
+    _tool_schemas = None
+
     def __init__(self, language_detector: "LanguageDetector"):
         super().__init__(name="support-agent")
         
         self.language_detector = language_detector
         
-        self.llm = OpenAIClient(
-            model="gpt-4o-mini",
-            temperature=0.7,
-            api_key=os.getenv("OPENAI_API_KEY")
-        )
+        if SupportAgent._llm is None:
+            SupportAgent._llm = OpenAIClient(
+                model="gpt-4o-mini",
+                temperature=0.7,
+                api_key=os.getenv("OPENAI_API_KEY")
+            )
+        self.llm = SupportAgent._llm
 
         # Initialize tools
         self.tool_registry = ToolRegistry()
         self.tool_registry.discover(self)
-        self.tool_schemas = self.tool_registry.get_schemas()
-
-        self.context.add_message({
-            "role": "system",
-            "content": """You are a helpful multilingual support agent.
-
-You can detect and respond in multiple languages:
-- Use the get_user_language tool to check what language the user is speaking
-- Respond in the same language as the user when appropriate
-- Default to English if unsure
+        # Tools read this session's detector, so only the schemas are shared
+        if SupportAgent._tool_schemas is None:
+            SupportAgent._tool_schemas = self.tool_registry.get_schemas()
+        self.tool_schemas = SupportAgent._tool_schemas
 
-Be helpful, concise, and friendly.""",
-        })
+        self.context.add_message({"role": "system", "content": SYSTEM_PROMPT})
 
     async def generate_response(self):
         """Generate language-aware responses."""
@@ -64,15 +109,14 @@ Be helpful, concise, and friendly.""",
         )
 
         tool_calls: List[ToolCall] = []
-        full_response = ""
+        response_parts: List[str] = []
 
-        async for chunk in response:
-            if chunk.content:
-                full_response += chunk.content
-                yield chunk.content
-            if chunk.tool_calls:
-                tool_calls.extend(chunk.tool_calls)
+        # Batched text means fewer chunk events through ProfanityFilter to TTS
+        async for text in coalesce_chunks(response, tool_calls):
+            response_parts.append(text)
+            yield text
 
+        full_response = "".join(response_parts)
         if full_response and not tool_calls:
             self.context.add_message({"role": "assistant", "content": full_response})
 
@@ -81,35 +125,39 @@ Be helpful, concise, and friendly.""",
                 tool_calls=tool_calls, parallel=True
             )
 
-            self.context.add_messages([
-                {
-                    "role": "assistant",
-                    "content": "",
-                    "tool_calls": [
-                        {
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.name,
-                                "arguments": str(tc.arguments),
-                            },
-                        }
-                        for tc in tool_calls
-                    ],
-                },
-                *[
-                    {"role": "tool", "tool_call_id": tc.id, "content": "" if result.content is None else str(result.content)}
-                    for tc, result in zip(tool_calls, results)
-                ],
-            ])
+            # Build the assistant tool_calls entry and the tool results in one pass
+            call_entries = []
+            messages = [{"role": "assistant", "content": full_response, "tool_calls": call_entries}]
+            for tc, result in zip(tool_calls, results):
+                call_entries.append({
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.name,
+                        "arguments": (
+                            json.dumps(tc.arguments) if isinstance(tc.arguments, dict)
+                            else str(tc.arguments)
+                        ),
+                    },
+                })
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": tc.id,
+                    "content": "" if result.content is None else str(result.content),
+                })
+            self.context.add_messages(messages)
+
+            # The call is over once end_call has run, so don't open another
+            # stream just to speak into a session that is being torn down
+            if any(tc.name == "end_call" for tc in tool_calls):
+                return
 
             final_response = await self.llm.chat(
                 messages=self.context.messages, stream=True
             )
 
-            async for chunk in final_response:
-                if chunk.content:
-                    yield chunk.content
+            async for text in coalesce_chunks(final_response):
+                yield text
 
     @function_tool()
     def get_user_language(self) -> str: